@@ -0,0 +1,42 @@
+class FunctionSymbol:
+
+    """
+    Represents one overloaded version of a function in the context of the symbol table.
+
+    The `FunctionSymbol` class stores the signature of a function declaration: the types and names
+    of its parameters and its return type. It is used to resolve calls across scopes during semantic analysis.
+
+    Attributes:
+        param_types (tuple): The types of the function's parameters (e.g., ("Int", "String")).
+        param_names (tuple): The names of the function's parameters (e.g., ("x", "y")).
+        return_type (str): The return type of the function.
+    """
+
+    __slots__ = ("param_types", "param_names", "return_type") # No per-instance __dict__
+
+    def __init__(self, param_types, param_names, return_type):
+
+        """
+        Initializes a new function object.
+
+        Args:
+            param_types (tuple): The types of the function's parameters.
+            param_names (tuple): The names of the function's parameters.
+            return_type (str): The return type of the function.
+        """
+
+        self.param_types = param_types
+        self.param_names = param_names
+        self.return_type = return_type
+
+
+    def __repr__(self):
+
+        """
+        Returns a string representation of the FunctionSymbol object, useful for debugging.
+
+        Returns:
+            str: A string in the format 'FunctionSymbol(param_types=<types>, param_names=<names>, return_type=<type>)'.
+        """
+
+        return f"FunctionSymbol(param_types={self.param_types}, param_names={self.param_names}, return_type={self.return_type})"
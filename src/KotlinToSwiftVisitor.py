@@ -1,31 +1,71 @@
-from antlr4 import ParseTreeVisitor
+import logging
+import sys
+from collections import Counter
+from antlr4.tree.Tree import TerminalNode
 from generated.antlr.KotlinParser import KotlinParser
 from Symbol import Symbol
 from Types import KotlinTypes
 from Utils import KOTLIN_2_SWIFT_TYPES, RESERVED_KEYWORDS
 
+logger = logging.getLogger(__name__)
 
-class KotlinToSwiftVisitor(ParseTreeVisitor):
+# Names of the Kotlin types, read once from the enum instead of on every comparison
+KOTLIN_INT = KotlinTypes.INT.value
+KOTLIN_STRING = KotlinTypes.STRING.value
+KOTLIN_BOOLEAN = KotlinTypes.BOOLEAN.value
+
+
+class KotlinToSwiftVisitor:
     
     """
     This class is responsible for translating Kotlin code into Swift. It visits the parse tree
     generated by the ANTLR parser, converting Kotlin constructs into their Swift equivalents. 
-    It also handles semantic checks.
+    It also handles semantic checks. Every node is dispatched explicitly to its `visit_*` method, 
+    so the generic ANTLR `ParseTreeVisitor` machinery is not needed.
 
     Attributes:
         symbol_table (SymbolTable): The symbol table that stores variables, functions, and classes.
         semantic_error_listener (SemanticErrorListener): A listener for semantic errors.
-        kotlin_2_swift_types (dict): A dictionary that maps Kotlin types to corresponding Swift types.
-        reserved_keywords (set): A set of reserved keywords in Kotlin that cannot be used as identifiers.
+
+    Class Attributes:
+        kotlin_2_swift_types (dict): A dictionary that maps the names of the Kotlin types to the names of the 
+                                     corresponding Swift types.
+        reserved_keywords (frozenset): A set of reserved keywords in Kotlin that cannot be used as identifiers.
+        supported_types (frozenset): The names of the Kotlin types supported by the transpiler.
+        unary_operand_types (dict): A dictionary that maps each unary operator token type to the Kotlin type 
+                                    of its operand.
+        literal_token_types (dict): A dictionary that maps each literal token type to its Kotlin type.
+        top_level_statement_visitors (dict): A dictionary that maps each top-level statement type to its visit method.
+        statement_visitors (dict): A dictionary that maps each statement type to its visit method.
+        class_body_visitors (dict): A dictionary that maps each class body statement type to its visit method.
+        expression_visitors (dict): A dictionary that maps each expression precedence level to its visit method.
+        binary_expression_types (tuple): The precedence levels whose children alternate operands and operators.
+        binary_expression_type_rules (dict): A dictionary that maps each binary precedence level to its operand 
+                                             type, result type and operator name for type checking.
+        expression_type_checkers (dict): A dictionary that maps each expression precedence level to its check method.
     """
 
+    # Flattened once from the enum mapping, so that a type name is translated with a single lookup
+    kotlin_2_swift_types = {kotlin_type.value: swift_type.value for kotlin_type, swift_type in KOTLIN_2_SWIFT_TYPES.items()}
+    reserved_keywords = frozenset(RESERVED_KEYWORDS)
+    supported_types = frozenset(kotlin_type.value for kotlin_type in KotlinTypes)
+    unary_operand_types = {
+        KotlinParser.NOT: KOTLIN_BOOLEAN,
+        KotlinParser.MINUS: KOTLIN_INT
+    }
+    literal_token_types = {
+        KotlinParser.INT_LITERAL: KOTLIN_INT,
+        KotlinParser.STRING_LITERAL: KOTLIN_STRING
+    }
+
 
     def __init__(self, symbol_table, semantic_error_listener):
         """
         Initializes an instance of the Kotlin-to-Swift visitor.
 
         This constructor sets the symbol table and semantic error listener for error checking
-        during translation. It also sets up dictionaries for type mapping and reserved keyword management.
+        during translation. Type mapping, reserved keywords and dispatch tables are shared class 
+        attributes and are not rebuilt per instance.
 
         Args:
             symbol_table (SymbolTable): The symbol table.
@@ -34,13 +74,9 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Attributes:
             symbol_table (SymbolTable): The symbol table that stores variables, functions, and classes.
             semantic_error_listener (SemanticErrorListener): A listener for semantic errors.
-            kotlin_2_swift_types (dict): A dictionary that maps Kotlin types to corresponding Swift types.
-            reserved_keywords (set): A set of reserved keywords in Kotlin that cannot be used as identifiers.            
         """
         self.symbol_table = symbol_table
         self.semantic_error_listener = semantic_error_listener        
-        self.kotlin_2_swift_types = KOTLIN_2_SWIFT_TYPES
-        self.reserved_keywords = RESERVED_KEYWORDS
 
 
     def visit_program(self, ctx: KotlinParser.ProgramContext):        
@@ -49,26 +85,39 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         top-level statements into corresponding Swift code.
 
         This method iterates over the top-level statements of the Kotlin program, converts
-        each statement into Swift code, and joins the results into a single Swift program.
+        each statement into Swift code, and joins the non-empty results into a single Swift program.
 
         Args:
             ctx (KotlinParser.ProgramContext): The context object representing the program node 
                                                in the Kotlin Parse Tree.
 
         Returns:
-            str: The translated Swift code, with top-level statements joined into a single string.
+            str: The translated Swift code, with top-level statements joined into a single string, 
+                 or None if the program contains no top-level statements.
 
-        Raises:
-            ValueError: If the program contains invalid top-level statements.
+        Prints:
+            A semantic error if the program contains no top-level statements.
         """     
         print("🚀 Visiting Kotlin code...")
-        print(f"    🔍 Visiting program: {ctx.getText()}")
-        
-        if(ctx.topLevelStatement()):
-            statements = [self.visit_top_level_statement(stmt) for stmt in ctx.topLevelStatement()]
-            return "\n".join(filter(None, statements)) # Joins non-empty strings with a newline separator.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting program: %s", self.get_text(ctx))
+        
+        top_level_statements = ctx.topLevelStatement()
+        if(top_level_statements):
+            statements = []
+            append_statement = statements.append
+            for stmt in top_level_statements:
+                swift_statement = self.visit_top_level_statement(stmt)
+                if swift_statement: # Keeps only non-empty strings
+                    append_statement(swift_statement)
+            return "\n".join(statements)
         else:
-            raise ValueError(f"    ❌ Invalid top level statement in program.")
+            self.semantic_error_listener.semantic_error(
+                msg = "Invalid top level statement in program.", 
+                line = ctx.start.line, 
+                column = ctx.start.column
+            )
+            return None
 
 
     def visit_top_level_statement(self, ctx: KotlinParser.TopLevelStatementContext):
@@ -91,15 +140,16 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Prints:
             An error message if the statement is unrecognized.
         """
-        print(f"    🔍 Visiting top level statement: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting top level statement: %s", self.get_text(ctx))
         
-        if ctx.classDeclaration():
-            return self.visit_class_declaration(ctx.classDeclaration())
-        elif ctx.commentStatement():
-            return self.visit_comment_statement(ctx.commentStatement())     
-        else: 
-            print(f"    ❌ Unrecognized statement: {ctx.getText()}")
+        # The statement has a single child, whose type selects the visitor
+        stmt = ctx.children[0] if ctx.children else None
+        visit_stmt = self.top_level_statement_visitors.get(type(stmt))
+        if visit_stmt is None:
+            print(f"    ❌ Unrecognized statement: {self.get_text(ctx)}")
             return None
+        return visit_stmt(self, stmt)
 
 
     def visit_class_declaration(self, ctx: KotlinParser.ClassDeclarationContext):
@@ -126,19 +176,20 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                                                         in the Kotlin Parse Tree.
 
         Returns:
-            str: The translated Swift code for the class declaration.
-
-        Raises:
-            ValueError: If properties in the class declaration are incorrectly formatted.
+            str: The translated Swift code for the class declaration, or None if there is an error.
 
         Prints:
-            An error message if the class has already been declared in the current scope.
+            An error message if the class has already been declared in the current scope, or if 
+            properties in the class declaration are incorrectly formatted.
         """
-        print(f"    🔍 Visiting class declaration: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting class declaration: %s", self.get_text(ctx))
 
         class_name = self.visit_identifier(ctx.IDENTIFIER())
 
-        if self.check_class_already_declared_in_current_scope(ctx = ctx, class_name=class_name):
+        if not class_name:
+            return None
+        elif self.check_class_already_declared_in_current_scope(ctx = ctx, class_name=class_name):
             return None
         else:
             self.symbol_table.add_class(class_name)
@@ -147,45 +198,48 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             propertyList = self.visit_property_list(ctx.propertyList()) if ctx.propertyList() else None
             constructor_params = self.visit_parameter_list(ctx.parameterList()) if ctx.parameterList() else None
             body = self.visit_class_body(ctx.classBody()) if ctx.classBody() else ""            
+
+            # The members are resolved, so the class scope is closed before the result is built, on every path
+            self.symbol_table.remove_scope()
             
             has_parentheses = ctx.LEFT_ROUND_BRACKET() is not None and ctx.RIGHT_ROUND_BRACKET() is not None                    
+            # The header is the same whatever the shape of the class
+            class_declaration = f"class {class_name}()" if has_parentheses else f"class {class_name}"
             
             if propertyList: 
                 properties_declarations = []
                 properties_assignments = []
-                constructor_params = []
-
-                for property in propertyList:
-                    values = property.split()
-
-                    if len(values) == 4:
-                        var_keyword, var_name, _, var_type = values
-                        var_value = None
-                    elif len(values) == 6:
-                        var_keyword, var_name, _, var_type, _, var_value = values                    
-                    else:
-                        raise ValueError(f"    ❌ Invalid properties: {propertyList}")
+                properties_params = []
+
+                for property_ctx, property in zip(ctx.propertyList().property_(), propertyList):
+                    # Invalid properties have already been reported
+                    if not property:
+                        return None
+                    
+                    var_keyword, var_name, var_type, var_value = property
+                    if not var_type:
+                        self.semantic_error_listener.semantic_error(
+                            msg = f"Invalid property '{var_name}': the type of a class property must be declared.", 
+                            line = property_ctx.start.line, 
+                            column = property_ctx.start.column
+                        )
+                        return None
     
                     properties_declarations.append(f"{var_keyword} {var_name}: {var_type}")
                     properties_assignments.append(f"self.{var_name} = {var_name}")
-                    constructor_params.append(f"{var_name}: {var_type}" + (f" = {var_value}" if var_value is not None else ""))
+                    properties_params.append(f"{var_name}: {var_type} = {var_value}" if var_value is not None else f"{var_name}: {var_type}")
     
                 properties_declarations = "\n".join(properties_declarations)
                 properties_assignments = "\n".join(properties_assignments)
-                constructor_params = ", ".join(constructor_params)
+                properties_params = ", ".join(properties_params)
 
-                constructor = f"init({constructor_params}) {{\n{properties_assignments}\n}}"
-                class_declaration = f"class {class_name}()" if has_parentheses else f"class {class_name}"
+                constructor = f"init({properties_params}) {{\n{properties_assignments}\n}}"
                 return f"{class_declaration} {{\n{properties_declarations}\n{constructor}\n{body}\n}}"
             
             elif constructor_params:
                 constructor = f"init({constructor_params}) {{}}"
-                class_declaration = f"class {class_name}()" if has_parentheses else f"class {class_name}"
                 return f"{class_declaration} {{\n{constructor}\n{body}\n}}"
             
-            self.symbol_table.remove_scope()
-
-            class_declaration = f"class {class_name}()" if has_parentheses else f"class {class_name}"
             return f"{class_declaration} {{\n{body}\n}}"
     
 
@@ -193,8 +247,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         """
         Handles identifiers in the Kotlin code, ensuring they are not reserved keywords.
 
-        This method checks whether an identifier is a reserved keyword in Kotlin and raises an 
-        error if the identifier conflicts with any keyword. It processes the identifier by 
+        This method checks whether an identifier is a reserved keyword in Kotlin and reports a 
+        semantic error if the identifier conflicts with any keyword. It processes the identifier by 
         extracting its name from the given context and ensures that it can be safely used in 
         the translated Swift code.
 
@@ -203,16 +257,19 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                                 Parse Tree.
 
         Returns:
-            str: The name of the identifier, if it is not a reserved keyword.
-
-        Raises:
-            ValueError: If the identifier is a reserved keyword in Kotlin.
+            str: The name of the identifier, or None if it is a reserved keyword.
         """
-        print(f"    🔍 Visiting identifier: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting identifier: %s", self.get_text(ctx))
         
-        identifier_name = ctx.getText()
+        identifier_name = self.get_identifier_name(ctx)
         if identifier_name in self.reserved_keywords:
-            raise ValueError(f"    ❌ '{identifier_name}' is a reserved keyword and cannot be used as an identifier.")
+            self.semantic_error_listener.semantic_error(
+                msg = f"'{identifier_name}' is a reserved keyword and cannot be used as an identifier.", 
+                line = ctx.getSymbol().line, 
+                column = ctx.getSymbol().column
+            )
+            return None
         return identifier_name
     
 
@@ -230,9 +287,11 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                                                     in the Kotlin Parse Tree.
 
         Returns:
-            list: A list of strings representing the properties in Swift syntax.
+            list: A list of tuples (keyword, var_name, swift_type, var_value), one per property, 
+                  or None for an invalid property.
         """
-        print(f"    🔍 Visiting property list: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting property list: %s", self.get_text(ctx))
         
         return [self.visit_property(property) for property in ctx.property_()]
 
@@ -241,8 +300,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         """
         Converts a Kotlin property into a Swift property.
 
-        This method processes a Kotlin property and translates it into the corresponding Swift 
-        property declaration. It does so by delegating to the `visit_var_declaration` method 
+        This method processes a Kotlin property and resolves the parts of the corresponding Swift 
+        property declaration. It does so by delegating to the `resolve_var_declaration` method 
         for further processing of the variable declaration associated with the property.
 
         Args:
@@ -250,11 +309,13 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                                                 in the Kotlin Parse Tree.
 
         Returns:
-            str: A string representing the Swift property declaration.
+            tuple: A tuple (keyword, var_name, swift_type, var_value) for the Swift property declaration, 
+                   or None if the property is invalid.
         """
-        print(f"    🔍 Visiting property: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting property: %s", self.get_text(ctx))
         
-        return self.visit_var_declaration(ctx.varDeclaration())
+        return self.resolve_var_declaration(ctx.varDeclaration())
     
 
     def visit_parameter_list(self, ctx: KotlinParser.ParameterListContext):
@@ -272,9 +333,10 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the Swift parameter list, with each parameter separated by a comma.
         """
-        print(f"    🔍 Visiting parameter list: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting parameter list: %s", self.get_text(ctx))
         
-        return ", ".join([self.visit_parameter(param) for param in ctx.parameter()])
+        return ", ".join(self.visit_parameter(param) for param in ctx.parameter())
 
 
     def visit_parameter(self, ctx: KotlinParser.ParameterContext):
@@ -293,10 +355,11 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             str: A string representing the Swift parameter, with its name, type, and optional 
             default value (if available).
         """
-        print(f"    🔍 Visiting parameter: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting parameter: %s", self.get_text(ctx))
         
         param_name = self.visit_identifier(ctx.IDENTIFIER())
-        param_type = self.visit_type(ctx.type_()) 
+        _, param_type = self.resolve_type(ctx.type_()) 
         if (ctx.expression()):
             param_value = self.visit_expression(ctx.expression()) 
             return f"{param_name}: {param_type} = {param_value}"
@@ -317,30 +380,31 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
 
         Returns:
             str: A string containing the converted Swift code for the class body, with each 
-            statement separated by newlines.
-
-        Raises:
-            ValueError: If an invalid statement is encountered in the class body.
-        """
-        print(f"    🔍 Visiting class body: {ctx.getText()}")
-        statements = []
-        if ctx.children:
-            for stmt in ctx.children:
-                if isinstance(stmt, KotlinParser.VarDeclarationContext):                
-                    statements.append(self.visit_var_declaration(stmt))
-                elif isinstance(stmt, KotlinParser.FunctionDeclarationContext):
-                    statements.append(self.visit_function_declaration(stmt))
-                elif isinstance(stmt, KotlinParser.AssignmentStatementContext):
-                    statements.append(self.visit_assignment_statement(stmt))
-                elif isinstance(stmt, KotlinParser.CommentStatementContext):
-                    statements.append(self.visit_comment_statement(stmt))
-                else:
-                    print(f"    ❌ Unrecognized statement: {stmt.getText()}")
+            statement separated by newlines, or None if the class body is invalid.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting class body: %s", self.get_text(ctx))
+        children = ctx.children
+        if children:
+            statements = []
+            append_statement = statements.append
+            class_body_visitors = self.class_body_visitors
+            for stmt in children:
+                visit_stmt = class_body_visitors.get(type(stmt))
+                if visit_stmt is None:
+                    print(f"    ❌ Unrecognized statement: {self.get_text(stmt)}")
                     return ""
-            # Join and return the non-empty statements
-            return "\n".join(filter(None, statements))
+                swift_statement = visit_stmt(self, stmt)
+                if swift_statement: # Keeps only non-empty strings
+                    append_statement(swift_statement)
+            return "\n".join(statements)
         else:
-            raise ValueError(f"    ❌ Invalid statement in class body.")
+            self.semantic_error_listener.semantic_error(
+                msg = "Invalid statement in class body.", 
+                line = ctx.start.line, 
+                column = ctx.start.column
+            )
+            return None
 
 
     def visit_var_declaration(self, ctx: KotlinParser.VarDeclarationContext):
@@ -365,17 +429,58 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             None: This method may invoke the semantic error listener in case of type mismatches
             or unsupported types detected.
         """
-        print(f"    🔍 Visiting variable declaration: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting variable declaration: %s", self.get_text(ctx))
         
+        var_declaration = self.resolve_var_declaration(ctx)
+        if not var_declaration:
+            return None
+        
+        keyword, var_name, swift_type, var_value = var_declaration
+        swift_var_declaration = f"{keyword} {var_name}"
+                    
+        if swift_type:
+            swift_var_declaration += f" : {swift_type}"
+
+        if var_value:
+            swift_var_declaration += f" = {var_value}"
+        
+        return swift_var_declaration     
+
+
+    def resolve_var_declaration(self, ctx: KotlinParser.VarDeclarationContext):
+        """
+        Checks a Kotlin variable declaration and resolves the parts of its Swift translation.
+
+        This method performs the semantic checks of a variable declaration (redeclaration, 
+        unsupported types, type mismatches) and adds the variable to the symbol table if the 
+        declaration is valid. The parts are returned separately, so that callers laying them out 
+        differently (e.g., class properties, split into declarations and initializer parameters) 
+        do not have to parse the rendered declaration.
+
+        Args:
+            ctx (KotlinParser.VarDeclarationContext): The context object representing the variable 
+                                                      declaration in the Kotlin Parse Tree.
+
+        Returns:
+            tuple: A tuple (keyword, var_name, swift_type, var_value), where swift_type is None if 
+                   the type is not declared and var_value is None if the variable is not assigned. 
+                   Returns None if the declaration is invalid.
+        """
         var_name = self.visit_identifier(ctx.IDENTIFIER())        
         mutable, keyword = (False, "let") if ctx.VAL() else (True, "var")
 
         # Check if the variable is already declared
-        if self.check_variable_already_declared_in_current_scope(ctx = ctx, var_name = var_name):
+        if not var_name:
+            return None
+        elif self.check_variable_already_declared_in_current_scope(ctx = ctx, var_name = var_name):
             return None
         else:
             # Check unsupported type            
-            kotlin_type = ctx.type_().getText() if ctx.type_() else self.check_expression_type(ctx.expression())
+            if ctx.type_():
+                kotlin_type, swift_type = self.resolve_type(ctx.type_())
+            else:
+                kotlin_type, swift_type = self.check_expression_type(ctx.expression()), None
 
             if not self.check_supported_type(ctx = ctx, type=kotlin_type):
                 return None
@@ -388,7 +493,7 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                 var_value = self.visit_expression(ctx.expression()) 
             elif ctx.readStatement():
                 # Check type is String 
-                if kotlin_type != KotlinTypes.STRING.value:
+                if kotlin_type != KOTLIN_STRING:
                     self.semantic_error_listener.semantic_error(
                         msg = f"Type mismatch: Variable declared as '{kotlin_type}' but assigned a value of type 'String'.", 
                         line = ctx.start.line, 
@@ -402,40 +507,74 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             # Add the variable to the symbol table
             self.add_variable_to_symbol_table(var_name=var_name, type=kotlin_type, mutable=mutable, value=var_value)
             
-            swift_type = self.visit_type(ctx.type_()) if ctx.type_() else None
-            
-            swift_var_declaration = f"{keyword} {var_name}"
-                        
-            if swift_type:
-                swift_var_declaration += f" : {swift_type}"
+            return keyword, var_name, swift_type, var_value
 
-            if var_value:
-                swift_var_declaration += f" = {var_value}"
-            
-            return swift_var_declaration     
 
-
-    def visit_type(self, ctx: KotlinParser.TypeContext): 
+    def resolve_type(self, ctx: KotlinParser.TypeContext):
         """
-        Converts Kotlin types to Swift types.
+        Resolves a Kotlin type into both its Kotlin and Swift names.
 
-        This method processes a Kotlin type and converts it into the corresponding Swift type.
-        If the Kotlin type is not supported, it returns None.
+        This method reads the text of the type node once and maps it to the corresponding Swift 
+        type, so that callers needing both names (e.g., for semantic checks and for the generated 
+        code) do not walk the type subtree twice. The Kotlin name is interned, so that it is the 
+        same object as the names of the Kotlin types and comparisons between equal types stop at 
+        the identity check. The result is stored on the node, so that a type checked and then 
+        translated (e.g., a parameter type) is resolved once.
 
         Args:
             ctx (KotlinParser.TypeContext): The context object representing the Kotlin type 
                                             in the Kotlin Parse Tree.
 
         Returns:
-            str: The corresponding Swift type as a string, or None if the Kotlin type is unsupported.
+            tuple: A tuple (kotlin_type, swift_type), where swift_type is None if the Kotlin type 
+                   is unsupported.
         """
-        print(f"    🔍 Visiting type: {ctx.getText()}")
-        
-        kotlin_type = ctx.getText()  
-        swift_type = self.kotlin_2_swift_types.get(KotlinTypes[kotlin_type.upper()], None)  
-        if not swift_type:
-            return None
-        return swift_type.value   
+        resolved_type = getattr(ctx, "resolved_type", None)
+        if resolved_type is None:
+            kotlin_type = sys.intern(self.get_text(ctx))
+            resolved_type = (kotlin_type, self.kotlin_2_swift_types.get(kotlin_type))
+            ctx.resolved_type = resolved_type
+        return resolved_type
+    
+
+    def get_text(self, ctx):
+        """
+        Returns the source text of a parse tree node, computing it at most once per node.
+
+        ANTLR's `getText()` concatenates the text of every token in the subtree on each call, so 
+        the result is stored on the node and reused by later visits, checks and error messages.
+
+        Args:
+            ctx: The context object (from the ANTLR parse tree) whose text is requested.
+
+        Returns:
+            str: The source text of the node.
+        """
+        text = getattr(ctx, "source_text", None)
+        if text is None:
+            text = ctx.getText()
+            ctx.source_text = text
+        return text
+
+
+    def get_identifier_name(self, node):
+        """
+        Returns the interned name of an IDENTIFIER terminal, computing it at most once per node.
+
+        Symbol-table keys are interned when declared, so interning references as well lets each 
+        dictionary probe succeed on string identity instead of a character-by-character comparison.
+
+        Args:
+            node: The IDENTIFIER terminal node whose name is requested.
+
+        Returns:
+            str: The interned name of the identifier.
+        """
+        name = getattr(node, "identifier_name", None)
+        if name is None:
+            name = sys.intern(node.getText())
+            node.identifier_name = name
+        return name
     
 
     def visit_assignment_statement(self, ctx: KotlinParser.AssignmentStatementContext):
@@ -456,7 +595,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             str: The Swift equivalent of the Kotlin assignment statement or None if there is an error, 
             such as an undeclared variable, a mutability issue, or a type mismatch.
         """
-        print(f"    🔍 Visiting assignment statement: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting assignment statement: %s", self.get_text(ctx))
         
         # Workaround for handling both assignments and function calls in the same rule.
         # If the assignment is a function call (e.g., test()), the callExpression is visited.
@@ -467,10 +607,12 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             var_name = self.visit_identifier(ctx.IDENTIFIER())
 
             # Check if variable is declared
-            if not self.check_variable_already_declared(ctx=ctx, var_name=var_name):        
+            if not var_name:
+                return None
+            elif not (variable := self.check_variable_already_declared(ctx=ctx, var_name=var_name)):        
                 return None
             else:
-                var_type, is_mutable = self.symbol_table.get_variable_info(var_name) 
+                var_type, is_mutable = variable.type, variable.mutable
 
                 # Check mutability
                 if not self.check_mutability(ctx=ctx, var_name=var_name, is_mutable=is_mutable):
@@ -478,7 +620,7 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                 
                 if ctx.readStatement():
                     # Check type is String 
-                    if var_type != KotlinTypes.STRING.value:
+                    if var_type != KOTLIN_STRING:
                         self.semantic_error_listener.semantic_error(
                             msg = f"Type mismatch: Variable declared as '{var_type}' but assigned a value of type 'String'.", 
                             line = ctx.start.line, 
@@ -487,7 +629,7 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                         return None
                 
                     var_value = self.visit_read_statement(ctx=ctx.readStatement())
-                    self.symbol_table.update_variable(name=var_name, new_value=var_value) 
+                    self.symbol_table.update_variable(name=var_name, new_value=var_value, variable=variable) 
                     return f"{var_name} = {var_value}"
                 else:
                     # Check type mismatch            
@@ -495,7 +637,7 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                         return None
                 
                     var_value = self.visit_expression(ctx=ctx.expression())
-                    self.symbol_table.update_variable(name=var_name, new_value=var_value) 
+                    self.symbol_table.update_variable(name=var_name, new_value=var_value, variable=variable) 
                     return f"{var_name} = {var_value}"
 
 
@@ -522,20 +664,25 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                  is already declared or if there are errors such as unsupported types, duplicate 
                  parameters, or missing return types.
         """
-        print(f"    🔍 Visiting function declaration: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting function declaration: %s", self.get_text(ctx))
 
         fun_name = self.visit_identifier(ctx.IDENTIFIER())   
-        kotlin_param_types = self.check_parameter_type_list(ctx.parameterList()) if ctx.parameterList() else None
+        if not fun_name:
+            return None
+        
+        parameter_list = ctx.parameterList()
+        parameters = self.check_parameter_list(parameter_list) if parameter_list else None
+        kotlin_param_types = tuple(param_type for _, param_type, _ in parameters if param_type is not None) if parameters else ()
 
         # Check if the variable is already declared
         if self.check_function_already_declared_in_current_scope(ctx = ctx, fun_name = fun_name, kotlin_param_types=kotlin_param_types):        
             return None
         else:
-            param_names = self.check_parameter_name_list(ctx.parameterList()) if ctx.parameterList() else None
-            param_names_values = self.check_parameter_name_value_list(ctx.parameterList()) if ctx.parameterList() else None
+            param_names = tuple(param_name for param_name, _, _ in parameters if param_name is not None) if parameters else ()
 
             if ctx.type_():
-                kotlin_return_type = ctx.type_().getText()
+                kotlin_return_type, swift_return_type = self.resolve_type(ctx.type_())
                 # Check unsupported return type
                 if not self.check_supported_type(ctx = ctx, type=kotlin_return_type):
                     return None
@@ -545,27 +692,24 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             self.symbol_table.add_function(fun_name, kotlin_param_types, param_names, kotlin_return_type)
             self.symbol_table.add_scope() 
 
-            if ctx.parameterList():
-                param_names_values_dict = {
-                    item.split(": ")[0]: item.split(": ")[1] if item.split(": ")[1] != "None" else None
-                    for item in param_names_values.split(", ")
-                }
-                
-                for param_type, param_name in zip(kotlin_param_types.split(", "), param_names.split(", ")):
+            if parameters:
+                for param_name, param_type, param_default in parameters:
+                    if param_name is None or param_type is None:
+                        continue
                     if self.check_variable_already_declared_in_current_scope(ctx = ctx, var_name = param_name):
                         continue
                     
-                    # Get value form param_names_values_dict
-                    param_value = param_names_values_dict.get(param_name, None)
+                    # The default value, if any, is the initial value of the parameter
+                    param_value = self.visit_expression(param_default) if param_default else None
 
                     # Add the variable to the symbol table
                     self.add_variable_to_symbol_table(var_name=param_name, type=param_type, mutable=False, value=param_value) 
 
                 # Check if the function declaration contains duplicated parameters
-                if not self.check_duplicate_parameters(ctx = ctx.parameterList(), fun_name=fun_name): 
+                if not self.check_duplicate_parameters(ctx = parameter_list, fun_name=fun_name, param_names=param_names): 
                     return None
 
-            parameters = self.visit_parameter_list(ctx.parameterList()) if ctx.parameterList() else ""
+            parameters = self.visit_parameter_list(parameter_list) if parameter_list else ""
 
             body = self.visit_block(ctx.block())        
 
@@ -574,8 +718,7 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                 return None
 
             if ctx.type_():
-                return_type = self.visit_type(ctx.type_()) 
-                swift_function = f"func {fun_name}({parameters}) -> {return_type} {{{body}}}"
+                swift_function = f"func {fun_name}({parameters}) -> {swift_return_type} {{{body}}}"
             else:
                 swift_function = f"func {fun_name}({parameters}) {{{body}}}"
 
@@ -601,10 +744,16 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             str: A string representing the Swift equivalent of the Kotlin block, with each statement 
                  joined by a newline.
         """
-        print(f"    🔍 Visiting block: {ctx.getText()}")        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting block: %s", self.get_text(ctx))
         
-        statements = [self.visit_statement(stmt) for stmt in ctx.statement()]
-        return "\n" + "\n".join(filter(None, statements)) + "\n"
+        statements = []
+        append_statement = statements.append
+        for stmt in ctx.statement():
+            swift_statement = self.visit_statement(stmt)
+            if swift_statement: # Keeps only non-empty strings
+                append_statement(swift_statement)
+        return "\n" + "\n".join(statements) + "\n"
 
 
     def visit_statement(self, ctx: KotlinParser.StatementContext):
@@ -623,26 +772,16 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             str: A string representing the Swift equivalent of the Kotlin statement. If the statement is 
                  unrecognized or invalid, an empty string is returned.
         """
-        print(f"    🔍 Visiting statement: {ctx.getText()}")
-        if ctx.readStatement():
-            return self.visit_read_statement(ctx.readStatement())
-        elif ctx.printStatement():
-            return self.visit_print_statement(ctx.printStatement())
-        elif ctx.ifElseStatement():
-            return self.visit_if_else_statement(ctx.ifElseStatement())
-        elif ctx.forStatement():
-            return self.visit_for_statement(ctx.forStatement())
-        elif ctx.assignmentStatement():
-            return self.visit_assignment_statement(ctx.assignmentStatement())
-        elif ctx.varDeclaration(): 
-            return self.visit_var_declaration(ctx.varDeclaration())
-        elif ctx.returnStatement():
-            return self.visit_return_statement(ctx.returnStatement())
-        elif ctx.commentStatement():
-            return self.visit_comment_statement(ctx.commentStatement())        
-        else: 
-            print(f"    ❌ Unrecognized statement: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting statement: %s", self.get_text(ctx))
+        
+        # The statement has a single child, whose type selects the visitor
+        stmt = ctx.children[0] if ctx.children else None
+        visit_stmt = self.statement_visitors.get(type(stmt))
+        if visit_stmt is None:
+            print(f"    ❌ Unrecognized statement: {self.get_text(ctx)}")
             return ""
+        return visit_stmt(self, stmt)
         
 
     def visit_read_statement(self, ctx: KotlinParser.ReadStatementContext):
@@ -660,8 +799,9 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the Swift equivalent of the Kotlin `readLine()` statement.
         """        
-        print(f"    🔍 Visiting read statement: {ctx.getText()}")
-        return f"readLine()"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting read statement: %s", self.get_text(ctx))
+        return "readLine()"
     
 
     def visit_print_statement(self, ctx: KotlinParser.PrintStatementContext):
@@ -678,7 +818,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string containing the Swift equivalent of the Kotlin print statement.
         """
-        print(f"    🔍 Visiting print statement: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting print statement: %s", self.get_text(ctx))
         
         expression = self.visit_expression(ctx.expression())
         
@@ -704,7 +845,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the Swift equivalent of the Kotlin `if`-`else` statement.
         """
-        print(f"    🔍 Visiting if statement: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting if statement: %s", self.get_text(ctx))
         
         condition = self.visit_expression(ctx.expression())
         
@@ -737,9 +879,10 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             str: A string representing the Swift equivalent of the Kotlin `if` body, 
                  either a block of statements or a single statement.
         """
-        print(f"    🔍 Visiting if-else statement: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting if-else statement: %s", self.get_text(ctx))
         
-        return self.visit_block(ctx.block()) if ctx.block() else self.visit_statement(ctx.statement())
+        return self.visit_block(block) if (block := ctx.block()) else self.visit_statement(ctx.statement())
 
 
     def visit_else_body(self, ctx: KotlinParser.ElseBodyContext):
@@ -758,9 +901,10 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             str: A string representing the Swift equivalent of the Kotlin `else` body, either a block of 
                  statements or a single statement.
         """
-        print(f"    🔍 Visiting if-else statement: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting if-else statement: %s", self.get_text(ctx))
         
-        return self.visit_block(ctx.block()) if ctx.block() else self.visit_statement(ctx.statement())
+        return self.visit_block(block) if (block := ctx.block()) else self.visit_statement(ctx.statement())
 
 
     def visit_for_statement(self, ctx: KotlinParser.ForStatementContext):
@@ -782,7 +926,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             str: A string representing the Swift equivalent of the Kotlin `for` loop, with the appropriate 
                  expression and body.
         """
-        print(f"    🔍 Visiting for statement: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting for statement: %s", self.get_text(ctx))
         
         self.check_membership_expression_type(ctx.membershipExpression())
         expression = self.visit_memebership_expression(ctx.membershipExpression())
@@ -810,10 +955,10 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             str: A string representing the Swift equivalent of the Kotlin `return` statement, either with 
                  or without an expression.
         """
-        print(f"    🔍 Visiting return statement: {ctx.getText()}")            
-        if ctx.expression():
-            expression = self.visit_expression(ctx.expression())
-            return f"return {expression}"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting return statement: %s", self.get_text(ctx))
+        if expression := ctx.expression():
+            return f"return {self.visit_expression(expression)}"
         return "return"   
 
 
@@ -822,8 +967,9 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Transforms a Kotlin expression into its Swift equivalent.
 
         This method is the entry point for visiting a variety of Kotlin expressions, including literals, 
-        identifiers, and operators. It processes the logical OR expressions by delegating the visit to 
-        `visit_logical_or_expression()`. 
+        identifiers, and operators. Precedence levels that wrap a single operand (e.g., a bare identifier 
+        or literal) are skipped, and the visit is delegated directly to the first level that applies an 
+        operator, or to `visit_primary_expression()` for a leaf. 
 
         Args:
             ctx (KotlinParser.ExpressionContext): The context object representing the expression 
@@ -832,9 +978,14 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift code for the given Kotlin expression.
         """
-        print(f"    🔍 Visiting expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting expression: %s", self.get_text(ctx))
         
-        return self.visit_logical_or_expression(ctx.logicalOrExpression())  
+        # Descend through the single-operand precedence levels without visiting them
+        node = ctx.logicalOrExpression()
+        while not isinstance(node, KotlinParser.PrimaryExpressionContext) and node.getChildCount() == 1:
+            node = node.getChild(0)
+        return f"{self.expression_visitors[type(node)](self, node)}"
 
 
     def visit_logical_or_expression(self, ctx: KotlinParser.LogicalOrExpressionContext):
@@ -842,9 +993,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Transforms a Kotlin logical OR expression into its Swift equivalent.
 
         This method handles the transformation of Kotlin logical OR expressions (i.e., `a || b`) into Swift. 
-        It processes the left and right operands of the logical OR and recursively delegates the handling of
-        logical AND expressions to `visit_logical_and_expression()`, as they are building blocks of the 
-        logical OR expressions. Operators (i.e., `||`) are placed between operands in the resulting Swift 
+        Its operands (logical AND expressions) and operators (i.e., `||`) are written in source order into 
+        a single buffer by `emit_binary_expression()`, which is joined once into the resulting Swift 
         expression.
 
         Args:
@@ -855,14 +1005,12 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift code for the logical OR expression.
         """
-        print(f"    🔍 Visiting logical OR expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting logical OR expression: %s", self.get_text(ctx))
         
-        left = self.visit_logical_and_expression(ctx.logicalAndExpression(0))
-        for i in range(1, len(ctx.logicalAndExpression())):
-            operator = ctx.getChild(2 * i - 1).getText()  # The operators are located at position 2i - 1 
-            right = self.visit_logical_and_expression(ctx.logicalAndExpression(i))
-            left = f"{left} {operator} {right}" if right is not None else f"{left}" 
-        return f"{left}"
+        parts = []
+        self.emit_binary_expression(ctx, parts)
+        return " ".join(parts)
     
 
     def visit_logical_and_expression(self, ctx: KotlinParser.LogicalAndExpressionContext):
@@ -870,9 +1018,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Transforms a Kotlin logical AND expression into its Swift equivalent.
 
         This method handles the transformation of Kotlin logical AND expressions (i.e., `a && b`) into Swift. 
-        It processes the left and right operands of the logical AND and recursively delegates the handling of
-        equality expressions to `visit_equality_expression()`, as they are building blocks of the logical AND 
-        expressions. Operators (i.e., `&&`) are placed between operands in the resulting Swift expression.
+        Its operands (equality expressions) and operators (i.e., `&&`) are written in source order into a 
+        single buffer by `emit_binary_expression()`, which is joined once into the resulting Swift expression.
 
         Args:
             ctx (KotlinParser.LogicalAndExpressionContext): The context object representing the 
@@ -882,14 +1029,12 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift code for the logical AND expression.
         """
-        print(f"    🔍 Visiting logical AND expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting logical AND expression: %s", self.get_text(ctx))
         
-        left = self.visit_equality_expression(ctx.equalityExpression(0))  
-        for i in range(1, len(ctx.equalityExpression())):
-            operator = ctx.getChild(2 * i - 1).getText()  # The operators are located at position 2i - 1 
-            right = self.visit_equality_expression(ctx.equalityExpression(i)) 
-            left = f"{left} {operator} {right}"
-        return f"{left}"
+        parts = []
+        self.emit_binary_expression(ctx, parts)
+        return " ".join(parts)
 
 
     def visit_equality_expression(self, ctx: KotlinParser.EqualityExpressionContext):
@@ -897,10 +1042,9 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Transforms a Kotlin equality expression into its Swift equivalent.
 
         This method handles the transformation of Kotlin equality expressions (i.e., `a == b` or `a != b`) 
-        into Swift. It processes the left and right operands of the equality expression and recursively 
-        delegates the handling of relational expressions to `visit_relational_expression()`, as they are 
-        the building blocks of the equality expression. Operators (i.e., `==` or `!=`) are placed between 
-        operands in the resulting Swift expression.
+        into Swift. Its operands (relational expressions) and operators (i.e., `==` or `!=`) are written in 
+        source order into a single buffer by `emit_binary_expression()`, which is joined once into the 
+        resulting Swift expression.
 
         Args:
             ctx (KotlinParser.EqualityExpressionContext): The context object representing the 
@@ -910,14 +1054,12 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift code for the equality expression.
         """
-        print(f"    🔍 Visiting equality expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting equality expression: %s", self.get_text(ctx))
         
-        left = self.visit_relational_expression(ctx.relationalExpression(0))
-        for i in range(1, len(ctx.relationalExpression())):
-            operator = ctx.getChild(2 * i - 1).getText()  # The operators are located at position 2i - 1 
-            right = self.visit_relational_expression(ctx.relationalExpression(i))  
-            left = f"{left} {operator} {right}"  
-        return f"{left}"
+        parts = []
+        self.emit_binary_expression(ctx, parts)
+        return " ".join(parts)
 
 
     def visit_relational_expression(self, ctx: KotlinParser.RelationalExpressionContext):
@@ -925,10 +1067,9 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Transforms a Kotlin relational expression into its Swift equivalent.
 
         This method handles the transformation of Kotlin relational expressions (e.g., `a < b`, `a > b`, 
-        `a <= b`, `a >= b`) into their Swift equivalents. It processes the left and right operands of the 
-        relational expression and delegates the handling of additive expressions (e.g., `a + b`, `a - b`) 
-        to `visit_additive_expression()`, as they are the building blocks of the relational expression. 
-        Operators (e.g., `<`, `>`, `<=`, `>=`) are placed between operands in the resulting Swift expression.
+        `a <= b`, `a >= b`) into their Swift equivalents. Its operands (additive expressions) and operator 
+        (e.g., `<`, `>`, `<=`, `>=`) are written in source order into a single buffer by 
+        `emit_binary_expression()`, which is joined once into the resulting Swift expression.
 
         Args:
             ctx (KotlinParser.RelationalExpressionContext): The context object representing the 
@@ -938,14 +1079,12 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift code for the relational expression.
         """
-        print(f"    🔍 Visiting relational expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting relational expression: %s", self.get_text(ctx))
         
-        left = self.visit_additive_expression(ctx.additiveExpression(0))
-        if len(ctx.additiveExpression()) > 1:
-            operator = ctx.getChild(1).getText()  # The operators are located at position 2i - 1 
-            right = self.visit_additive_expression(ctx.additiveExpression(1))
-            return f"{left} {operator} {right}" 
-        return f"{left}"
+        parts = []
+        self.emit_binary_expression(ctx, parts)
+        return " ".join(parts)
 
 
     def visit_additive_expression(self, ctx: KotlinParser.AdditiveExpressionContext):
@@ -953,10 +1092,9 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Transforms a Kotlin additive expression into its Swift equivalent.
 
         This method handles the transformation of Kotlin additive expressions (e.g., `a + b`, `a - b`) 
-        into their Swift equivalents. It processes the left and right operands of the additive expression
-        and delegates the handling of multiplicative expressions (e.g., `a * b`, `a / b`) to 
-        `visit_multiplicative_expression()`, as they are the building blocks of the additive expressions. 
-        Operators (e.g., `+`, `-`) are placed between operands in the resulting Swift expression.
+        into their Swift equivalents. Its operands (multiplicative expressions) and operators (e.g., `+`, `-`) 
+        are written in source order into a single buffer by `emit_binary_expression()`, which is joined 
+        once into the resulting Swift expression.
 
         Args:
             ctx (KotlinParser.AdditiveExpressionContext): The context object representing the
@@ -966,14 +1104,12 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift code for the additive expression.
         """
-        print(f"    🔍 Visiting additive expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting additive expression: %s", self.get_text(ctx))
         
-        left = self.visit_multiplicative_expression(ctx.multiplicativeExpression(0))
-        for i in range(1, len(ctx.multiplicativeExpression())):
-            operator = ctx.getChild(2 * i - 1).getText()  # The operators are located at position 2i - 1 
-            right = self.visit_multiplicative_expression(ctx.multiplicativeExpression(i)) 
-            left = f"{left} {operator} {right}" 
-        return f"{left}"  
+        parts = []
+        self.emit_binary_expression(ctx, parts)
+        return " ".join(parts)
 
 
     def visit_multiplicative_expression(self, ctx: KotlinParser.MultiplicativeExpressionContext):
@@ -981,10 +1117,9 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Transforms a Kotlin multiplicative expression into its Swift equivalent.
 
         This method handles the transformation of Kotlin multiplicative expressions (e.g., `a * b`, `a / b`, 
-        `a % b`) into their Swift equivalents. It processes the left and right operands of the 
-        multiplicative expression and delegates the handling of unary expressions (e.g., `-a`, `+a`) to 
-        `visit_unary_expression()`, as they are the building blocks of the multiplicative expressions. 
-        Operators (e.g., `*`, `/`, `%`) are placed between operands in the resulting Swift expression.
+        `a % b`) into their Swift equivalents. Its operands (unary expressions, e.g., `-a`) and operators 
+        (e.g., `*`, `/`, `%`) are written in source order into a single buffer by `emit_binary_expression()`, 
+        which is joined once into the resulting Swift expression.
 
         Args:
             ctx (KotlinParser.MultiplicativeExpressionContext): The context object representing the 
@@ -994,14 +1129,44 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift code for the multiplicative expression.
         """
-        print(f"    🔍 Visiting multiplicative expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting multiplicative expression: %s", self.get_text(ctx))
         
-        left = self.visit_unary_expression(ctx.unaryExpression(0))
-        for i in range(1, len(ctx.unaryExpression())):
-            operator = ctx.getChild(2 * i - 1).getText()  # The operators are located at position 2i - 1 
-            right = self.visit_unary_expression(ctx.unaryExpression(i))
-            left = f"{left} {operator} {right}" 
-        return f"{left}" 
+        parts = []
+        self.emit_binary_expression(ctx, parts)
+        return " ".join(parts)
+
+
+    def emit_binary_expression(self, ctx, parts):
+        """
+        Writes the Swift tokens of a binary operator expression into a shared buffer.
+
+        This method walks the children of a binary precedence level (logical OR down to multiplicative) 
+        once, in source order. Operators are appended as they are, nested binary levels write into the 
+        same buffer recursively, and any other operand (unary, membership or primary expression) is 
+        visited and appended as a single token. Levels that only wrap a single operand are skipped. 
+        This way an expression is concatenated once by its caller, instead of re-building the 
+        intermediate string of every operand at every enclosing precedence level.
+
+        Args:
+            ctx: The context object representing a binary precedence level in the Kotlin Parse Tree.
+            parts (list): The buffer the Swift tokens are appended to.
+
+        Returns:
+            None
+        """
+        append_part = parts.append
+        for child in ctx.children:
+            if isinstance(child, TerminalNode):
+                append_part(child.getText()) # Operator
+                continue
+            # Descend through the single-operand precedence levels without visiting them
+            while not isinstance(child, KotlinParser.PrimaryExpressionContext) and child.getChildCount() == 1:
+                child = child.getChild(0)
+            if isinstance(child, self.binary_expression_types):
+                self.emit_binary_expression(child, parts)
+            else:
+                append_part(f"{self.expression_visitors[type(child)](self, child)}")
 
 
     def visit_unary_expression(self, ctx: KotlinParser.UnaryExpressionContext):
@@ -1021,14 +1186,15 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift code for the unary expression.
         """
-        print(f"    🔍 Visiting unary expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting unary expression: %s", self.get_text(ctx))
         
-        if ctx.NOT(): 
-            return f"!{self.visit_primary_expression(ctx.primaryExpression())}"
-        elif ctx.MINUS():
-            return f"-{self.visit_primary_expression(ctx.primaryExpression())}"
-        else:
-            return f"{self.visit_memebership_expression(ctx.membershipExpression())}"
+        # Either a NOT/MINUS operator token followed by a primary expression, or a membership expression
+        first = ctx.getChild(0)
+        if isinstance(first, TerminalNode):
+            # `!` and `-` are spelled the same in Swift
+            return f"{first.getText()}{self.visit_primary_expression(ctx.getChild(1))}"
+        return f"{self.visit_memebership_expression(first)}"
 
 
     def visit_memebership_expression(self, ctx: KotlinParser.MembershipExpressionContext):
@@ -1049,16 +1215,16 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift code for the membership expression.
         """
-        print(f"    🔍 Visiting membership expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting membership expression: %s", self.get_text(ctx))
         
-        left = self.visit_primary_expression(ctx.primaryExpression())
-        if ctx.rangeExpression():
-            right = self.visit_range_expression(ctx.rangeExpression())
+        # The children are either the primary expression alone, or followed by `in` or `!in` and a range
+        children = ctx.children
+        left = self.visit_primary_expression(children[0])
+        if len(children) > 1:
+            right = self.visit_range_expression(children[-1])
             if right:   
-                if ctx.NOT() and ctx.IN():
-                    return f"{left} !in {right}"
-                elif ctx.IN():
-                    return f"{left} in {right}"
+                return f"{left} !in {right}" if len(children) == 4 else f"{left} in {right}"
         return f"{left}"
     
 
@@ -1081,16 +1247,20 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift code for the primary expression.   
         """
-        print(f"    🔍 Visiting primary expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting primary expression: %s", self.get_text(ctx))
         
-        if ctx.IDENTIFIER():
-            return ctx.IDENTIFIER().getText()              
-        elif ctx.LEFT_ROUND_BRACKET() and ctx.RIGHT_ROUND_BRACKET():
-            return f"({self.visit_expression(ctx.expression())})"  
-        elif ctx.callExpression():
-            return self.visit_call_expression(ctx.callExpression())
-        elif ctx.literal():
-            return self.visit_literal(ctx.literal())
+        # The first child alone tells which alternative of the rule was matched
+        first = ctx.getChild(0)
+        if isinstance(first, TerminalNode):
+            if first.getSymbol().type == KotlinParser.LEFT_ROUND_BRACKET:
+                return f"({self.visit_expression(ctx.getChild(1))})"  
+            return first.getText()              
+        elif isinstance(first, KotlinParser.CallExpressionContext):
+            return self.visit_call_expression(first)
+        elif isinstance(first, KotlinParser.LiteralContext):
+            # Literals are copied as they are written
+            return self.get_text(first)
 
 
     def visit_range_expression(self, ctx: KotlinParser.RangeExpressionContext):
@@ -1110,17 +1280,20 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift code for the range expression.
         """
-        print(f"    🔍 Visiting range expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting range expression: %s", self.get_text(ctx))
         
-        left = self.visit_additive_expression(ctx.additiveExpression(0))
-        if not ctx.additiveExpression(1):
+        # The bounds are collected from the children once and indexed afterwards
+        bounds = ctx.additiveExpression()
+        left = self.visit_additive_expression(bounds[0])
+        if len(bounds) < 2:
             self.semantic_error_listener.semantic_error(
-                msg = f"Invalid range found.", 
+                msg = "Invalid range found.", 
                 line = ctx.start.line, 
                 column = ctx.start.column
             )
             return None
-        right = self.visit_additive_expression(ctx.additiveExpression(1))        
+        right = self.visit_additive_expression(bounds[1])        
         return f"{left} ... {right}"
 
 
@@ -1142,16 +1315,18 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift function call.
         """
-        print(f"    🔍 Visiting call expression: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting call expression: %s", self.get_text(ctx))
         
-        fun_name = self.visit_identifier(ctx.IDENTIFIER())
+        # A reference, not a declaration: the name cannot be a keyword, which the lexer tokenizes apart
+        fun_name = self.get_identifier_name(ctx.IDENTIFIER())
         
         self.check_call_expression(ctx) 
 
-        if ctx.argumentList():    
+        if argument_list := ctx.argumentList():    
             if not self.check_arguments(ctx, fun_name): 
                 return None
-            arguments = self.visit_argument_list(ctx.argumentList()) 
+            arguments = self.visit_argument_list(argument_list) 
             return f"{fun_name}({arguments})"
         
         return f"{fun_name}()"
@@ -1174,9 +1349,10 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: A string representing the transformed Swift arguments, separated by commas.
         """
-        print(f"    🔍 Visiting argument list: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting argument list: %s", self.get_text(ctx))
         
-        return ", ".join([self.visit_argument(argument) for argument in ctx.argument()])
+        return ", ".join(self.visit_argument(argument) for argument in ctx.argument())
     
 
     def visit_argument(self, ctx: KotlinParser.ArgumentContext):
@@ -1196,36 +1372,15 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             str: A string representing the transformed Swift argument, either as a named argument 
                  (e.g., `name: value`) or just the argument value (e.g., `value`).
         """
-        print(f"    🔍 Visiting argument: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting argument: %s", self.get_text(ctx))
         
         argument_value = self.visit_expression(ctx.expression()) 
-        if (ctx.IDENTIFIER()):
-            argument_name = self.visit_identifier(ctx.IDENTIFIER())
-            return f"{argument_name}: {argument_value}"
+        if (identifier := ctx.IDENTIFIER()):
+            return f"{self.get_identifier_name(identifier)}: {argument_value}"
         return f"{argument_value}"
 
 
-    def visit_literal(self, ctx: KotlinParser.LiteralContext):
-        """
-        Handles literal expressions in Kotlin, such as string, integer, or boolean literals.
-
-        This method processes a literal expression in Kotlin and directly returns its string representation.
-        The literal can be of various types, including numbers, booleans, or strings. This function does not 
-        modify or interpret the literal value but simply returns it as it appears in the Kotlin source code.
-
-        Args:
-            ctx (KotlinParser.LiteralContext): The context object representing a literal expression 
-                                               in the Kotlin Parse Tree.
-
-        Returns:
-            str: The string representation of the literal value in Kotlin, which is directly returned
-                 as-is for use in Swift code.
-        """
-        print(f"    🔍 Visiting literal: {ctx.getText()}")
-        
-        return ctx.getText()
-
-
     def visit_comment_statement(self, ctx: KotlinParser.CommentStatementContext):
         """
         Converts Kotlin comments to Swift comments.
@@ -1240,7 +1395,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: The transformed comment in Swift syntax, either a single-line or block comment.
         """
-        print(f"    🔍 Visiting comment: {ctx.getText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting comment: %s", self.get_text(ctx))
         if ctx.LINE_COMMENT():
             return self.visit_line_comment(ctx.LINE_COMMENT())
         elif ctx.BLOCK_COMMENT():
@@ -1263,8 +1419,9 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: The transformed comment in Swift syntax, prefixed with '#'.
         """
-        print(f"    🔍 Visiting inline comment: {ctx.getText()}")
-        comment = ctx.getText()[2:].strip() 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting inline comment: %s", self.get_text(ctx))
+        comment = self.get_text(ctx)[2:].strip() 
         return f"# {comment}"
 
 
@@ -1282,8 +1439,9 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: The transformed comment in Swift syntax, enclosed in '/*' and '*/'.
         """
-        print(f"    🔍 Visiting block comment: {ctx.getText()}")
-        comment = ctx.getText()[2:-2].strip() 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Visiting block comment: %s", self.get_text(ctx))
+        comment = self.get_text(ctx)[2:-2].strip() 
         return f"/* {comment} */" 
     
 
@@ -1307,7 +1465,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             None
         """
-        print(f"    🔍 Adding variable {var_name} to the symbol table.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Adding variable %s to the symbol table.", var_name)
         
         symbol = Symbol(name=var_name, type=type, mutable=mutable, value = value)
         self.symbol_table.add_variable(var_name, symbol)
@@ -1327,18 +1486,21 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             var_name (str): The name of the variable to check.
 
         Returns:
-            bool: `True` if the variable is found in the symbol table; otherwise, `False`.
+            Symbol: The variable found in the symbol table, so that callers can read its type, 
+                    mutability and value without looking it up again; otherwise, `None`.
         """
-        print(f"    🔍 Checking if variable {var_name} is already declared.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking if variable %s is already declared.", var_name)
         
-        if not self.symbol_table.lookup_variable(var_name):
+        variable = self.symbol_table.lookup_variable(var_name)
+        if not variable:
             self.semantic_error_listener.semantic_error(
                 msg = f"Trying to access or assign variable '{var_name}' before its declaration.", 
                 line = ctx.start.line, 
                 column = ctx.start.column
             )
-            return False
-        return True
+            return None
+        return variable
 
 
     def check_variable_already_declared_in_current_scope(self, ctx, var_name):
@@ -1359,7 +1521,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             bool: `True` if the variable is already declared in the current scope; 
                   otherwise, `False`.
         """
-        print(f"    🔍 Checking if variable {var_name} is already declared in the current scope.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking if variable %s is already declared in the current scope.", var_name)
         
         if self.symbol_table.lookup_variable_in_current_scope(var_name):
             self.semantic_error_listener.semantic_error(
@@ -1386,22 +1549,24 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             var_name (str): The name of the variable to check.
 
         Returns:
-            bool: `True` if the variable is declared and assigned; otherwise, `False`.
+            Symbol: The variable if it is declared and assigned; otherwise, `None`.
         """
-        print(f"    🔍 Checking if the variable {ctx.getText()} is already assigned.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking if the variable %s is already assigned.", self.get_text(ctx))
         
-        if not self.check_variable_already_declared(ctx, var_name): 
-            return False
+        variable = self.check_variable_already_declared(ctx, var_name)
+        if not variable: 
+            return None
     
-        if not self.symbol_table.get_variable_assigned(var_name):
+        if variable.value is None:
             self.semantic_error_listener.semantic_error(
                 msg = f"Variable '{var_name}' is not assigned yet.",
                 line = ctx.start.line,
                 column = ctx.start.column
             )
-            return False
+            return None
         
-        return True
+        return variable
     
 
     def check_variable_not_assigned(self, ctx, var_name):
@@ -1421,12 +1586,14 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             bool: `True` if the variable is declared and assigned; otherwise, `False`.
         """
-        print(f"    🔍 Checking if the variable {ctx.getText()} is already assigned.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking if the variable %s is already assigned.", self.get_text(ctx))
         
-        if not self.check_variable_already_declared(ctx, var_name): 
+        variable = self.check_variable_already_declared(ctx, var_name)
+        if not variable: 
             return False
     
-        if self.symbol_table.get_variable_assigned(var_name):
+        if variable.value is not None:
             self.semantic_error_listener.semantic_error(
                 msg = f"Variable '{var_name}' is already assigned.",
                 line = ctx.start.line,
@@ -1441,8 +1608,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         """
         Validates if the given Kotlin type is supported by the transpiler.
 
-        This method checks if the provided type exists within the predefined list of supported
-        Kotlin types, which is derived from the `KotlinTypes` enum. If the type is unsupported, 
+        This method checks if the provided type exists within the predefined set of supported
+        Kotlin types, which is derived once from the `KotlinTypes` enum. If the type is unsupported, 
         a semantic error is raised.
 
         Args:
@@ -1452,9 +1619,10 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             bool: `True` if the type is supported; otherwise, `False`.
         """
-        print(f"    🔍 Checking if type {type} is supported.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking if type %s is supported.", type)
         
-        if type not in [item.value for item in KotlinTypes]:
+        if type not in self.supported_types:
             self.semantic_error_listener.semantic_error(
                 msg = f"Unsupported type '{type}'.",
                 line = ctx.start.line,
@@ -1479,7 +1647,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             bool: `True` if the value's type matches the expected type; otherwise, `False`.
         """
-        print(f"    🔍 Checking if the variable {ctx.getText()} has a valid type.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking if the variable %s has a valid type.", self.get_text(ctx))
         
         value_type = self.check_expression_type(ctx.expression())
         
@@ -1511,7 +1680,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             bool: `True` if the variable is mutable and the assignment is valid; `False` if the variable
                 is immutable and the assignment is not allowed.
         """
-        print(f"    🔍 Checking if the variable {var_name} is mutable.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking if the variable %s is mutable.", var_name)
                 
         if not is_mutable:
             if not self.check_variable_not_assigned(ctx=ctx, var_name=var_name):               
@@ -1537,10 +1707,11 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             bool: `True` if the condition is valid (i.e., evaluates to a boolean); `False` otherwise.
         """
-        print(f"    🔍 Validating if statement condition.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Validating if statement condition.")
         
         condition_type = self.check_expression_type(ctx=ctx.expression())
-        if condition_type != KotlinTypes.BOOLEAN.value:
+        if condition_type != KOTLIN_BOOLEAN:
             self.semantic_error_listener.semantic_error(
                 msg = f"Invalid expression type in 'if' condition: expected Boolean, found '{condition_type}'.", 
                 line = ctx.start.line, 
@@ -1556,7 +1727,9 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
 
         This method evaluates the expression represented in the given context to determine 
         its type. It is the entry point for type-checking all expressions, starting with 
-        logical OR expressions.
+        logical OR expressions. The resulting type is stored on the context itself, so an 
+        expression checked again (e.g., by a return type mismatch report) is not re-walked 
+        and its semantic errors are not reported twice.
 
         Args:
             ctx: The context object (from the ANTLR parse tree) representing the expression.
@@ -1564,197 +1737,73 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: The type of the expression (e.g., "Int", "Boolean", "String").
         """                
-        print(f"    🔍 Checking the type of the expression {ctx.getText()}.")
-        
-        return self.check_logical_or_expression_type(ctx.logicalOrExpression())
-    
+        expression_type = getattr(ctx, "kotlin_type", None)
+        if expression_type is not None:
+            return expression_type
 
-    def check_logical_or_expression_type(self, ctx):
-        """
-        Determines the type of a logical OR expression ('||') and validates operand compatibility.
-
-        This method checks whether the operands of the logical OR expression are of type 'Boolean'.
-        If the types are incompatible, a semantic error is reported.
-
-        Args:
-            ctx: The context object representing the logical OR expression in the ANTLR parse tree.
-
-        Returns:
-            str: 'Boolean' or left operand type if the expression is valid; otherwise, 'None'.
-        """
-        print(f"    🔍 Checking the type of the logical or expression {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the type of the expression %s.", self.get_text(ctx))
         
-        left_type = self.check_logical_and_expression_type(ctx.logicalAndExpression(0))
-
-        if(len(ctx.logicalAndExpression()) > 1):
-            for i in range(1, len(ctx.logicalAndExpression())):
-                right_type = self.check_logical_and_expression_type(ctx.logicalAndExpression(i))
-                if right_type != left_type or right_type != KotlinTypes.BOOLEAN.value:
-                    self.semantic_error_listener.semantic_error(
-                        msg = f"Cannot apply logical or operator to operands of type '{left_type}' and '{right_type}' in expression '{ctx.getText()}'", 
-                        line = ctx.start.line, 
-                        column = ctx.start.column
-                    )
-                    return "None"
-            return KotlinTypes.BOOLEAN.value            
-        return left_type
+        expression_type = self.check_operand_type(ctx.logicalOrExpression())
+        ctx.kotlin_type = expression_type
+        return expression_type
     
 
-    def check_logical_and_expression_type(self, ctx):
+    def check_binary_expression_type(self, ctx):
         """
-        Determines the type of a logical AND expression ('&&') and validates operand compatibility.
+        Determines the type of a binary operator expression and validates operand compatibility.
 
-        This method checks whether the operands of the logical AND expression are of type 'Boolean'.
-        If the types are incompatible, a semantic error is reported.
+        This method handles every binary precedence level (logical OR, logical AND, equality, 
+        relational, additive and multiplicative) with the rules in `binary_expression_type_rules`: 
+        all operands must have the same type, which must also be the type required by the 
+        operator, if any (e.g., 'Boolean' for '||', 'Int' for '+'). The operands are the children 
+        in even positions, since they alternate with the operator tokens.
 
         Args:
-            ctx: The context object representing the logical AND expression in the ANTLR parse tree.
+            ctx: The context object representing a binary precedence level in the ANTLR parse tree.
 
         Returns:
-            str: 'Boolean' or left operand type if the expression is valid; otherwise, 'None'.
+            str: The result type of the operator or the operand type if there is a single operand; 
+                 otherwise, 'None' if the operand types are incompatible.
         """
-        print(f"    🔍 Checking the type of the logical and expression {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the type of the binary expression %s.", self.get_text(ctx))
         
-        left_type = self.check_equality_expression_type(ctx.equalityExpression(0))
+        operands = ctx.children[::2]
+        left_type = self.check_operand_type(operands[0])
 
-        if(len(ctx.equalityExpression()) > 1):
-            for i in range(1, len(ctx.equalityExpression())):
-                right_type = self.check_equality_expression_type(ctx.equalityExpression(i))
-                if right_type != left_type or right_type != KotlinTypes.BOOLEAN.value:                
+        if len(operands) > 1:
+            operand_type, result_type, operator_name = self.binary_expression_type_rules[type(ctx)]
+            for operand in operands[1:]:
+                right_type = self.check_operand_type(operand)
+                if right_type != left_type or (operand_type is not None and right_type != operand_type):
                     self.semantic_error_listener.semantic_error(
-                        msg = f"Cannot apply logical and operator to operands of type '{left_type}' and '{right_type}' in expression '{ctx.getText()}'", 
+                        msg = f"Cannot apply {operator_name} operator to operands of type '{left_type}' and '{right_type}' in expression '{self.get_text(ctx)}'", 
                         line = ctx.start.line, 
                         column = ctx.start.column
                     )
                     return "None"
-            return KotlinTypes.BOOLEAN.value                       
+            return result_type
         return left_type
-    
-    
-    def check_equality_expression_type(self, ctx):
-        """
-        Determines the type of an equality expression ('==' or '!=') and validates operand 
-        compatibility.
-        
-        This method checks whether the operands of the equality expression are of the same type,
-        and ensures that the result is of type 'Boolean'.
 
-        Args:
-            ctx: The context object representing the equality expression in the ANTLR parse tree.
 
-        Returns:
-            str: 'Boolean' or left operand type if the expression is valid; otherwise, 'None'.
+    def check_operand_type(self, ctx):
         """
-        print(f"    🔍 Checking the type of the equality expression {ctx.getText()}.")
-        
-        left_type = self.check_relational_expression_type(ctx.relationalExpression(0))
-        
-        if(len(ctx.relationalExpression()) > 1):
-            for i in range(1, len(ctx.relationalExpression())):
-                right_type = self.check_relational_expression_type(ctx.relationalExpression(i))
-                if right_type != left_type:
-                    self.semantic_error_listener.semantic_error(
-                        msg = f"Cannot apply equality operator to operands of type '{left_type}' and '{right_type}' in expression '{ctx.getText()}'", 
-                        line = ctx.start.line, 
-                        column = ctx.start.column
-                    )
-                    return "None"
-            return KotlinTypes.BOOLEAN.value            
-        return left_type
-    
+        Determines the type of an operand at any expression precedence level.
 
-    def check_relational_expression_type(self, ctx):
-        """
-        Determines the type of a relational expression ('<', '<=', '>', '>=') and validates operand 
-        compatibility.
-        
-        This method checks whether the operands of the relational expression are of the same type,
-        and ensures that the result is of type 'Boolean'.
+        Precedence levels that only wrap a single operand are skipped, since their type is the type 
+        of that operand, and the innermost meaningful level is dispatched to its check method 
+        through `expression_type_checkers`.
 
         Args:
-            ctx: The context object representing the relational expression in the ANTLR parse tree.
+            ctx: The context object representing an expression precedence level in the ANTLR parse tree.
 
         Returns:
-            str: 'Boolean' or left operand type if the expression is valid; otherwise, 'None'.
+            str: The type of the operand, or 'None' if it is not valid.
         """
-        print(f"    🔍 Checking the type of the relational expression {ctx.getText()}.")
-        
-        left_type = self.check_additive_expression_type(ctx.additiveExpression(0))  
-                
-        if len(ctx.additiveExpression()) > 1:
-            right_type = self.check_additive_expression_type(ctx.additiveExpression(1)) 
-            if right_type != left_type or right_type != KotlinTypes.INT.value:
-                self.semantic_error_listener.semantic_error(
-                    msg = f"Cannot apply relational operator to operands of type '{left_type}' and '{right_type}' in expression '{ctx.getText()}'", 
-                    line = ctx.start.line, 
-                    column = ctx.start.column
-                )
-                return "None"
-            return KotlinTypes.BOOLEAN.value                     
-        return left_type
-
-
-    def check_additive_expression_type(self, ctx):
-        """
-        Determines the type of an additive expression ('+' or '-') and validates operand compatibility.
-        
-        This method checks whether the operands of the additive expression are of the same type,
-        and ensures that the result is of type 'Int'.
-
-        Args:
-            ctx: The context object representing the additive expression in the ANTLR parse tree.
-
-        Returns:
-            str: 'Int' or left operand type if the expression is valid; otherwise, 'None'.
-        """
-        print(f"    🔍 Checking the type of the additive expression {ctx.getText()}.")
-        
-        left_type = self.check_multiplicative_expression_type(ctx.multiplicativeExpression(0))
-        
-        if(len(ctx.multiplicativeExpression()) > 1):
-            for i in range(1, len(ctx.multiplicativeExpression())):
-                right_type = self.check_multiplicative_expression_type(ctx.multiplicativeExpression(i))
-                if right_type != left_type or right_type != KotlinTypes.INT.value:
-                    self.semantic_error_listener.semantic_error(
-                        msg = f"Cannot apply additive operator to operands of type '{left_type}' and '{right_type}' in expression '{ctx.getText()}'", 
-                        line = ctx.start.line, 
-                        column = ctx.start.column
-                    )
-                    return "None"
-            return KotlinTypes.INT.value
-        return left_type
-
-    
-    def check_multiplicative_expression_type(self, ctx):
-        """
-        Determines the type of a multiplicative expression ('*', '/', '%') and validates operand 
-        compatibility.
-        
-        This method checks whether the operands of the multiplicative expression are of the same type,
-        and ensures that the result is of type 'Int'.
-
-        Args:
-            ctx: The context object representing the multiplicative expression in the ANTLR parse tree.
-
-        Returns:
-            str: 'Int' or left operand type if the expression is valid; otherwise, 'None'.
-        """
-        print(f"    🔍 Checking the type of the multiplicative expression {ctx.getText()}.")
-        
-        left_type = self.check_unary_expression_type(ctx.unaryExpression(0))
-
-        if(len(ctx.unaryExpression()) > 1):
-            for i in range(1, len(ctx.unaryExpression())):
-                right_type = self.check_unary_expression_type(ctx.unaryExpression(i))
-                if right_type != left_type or right_type != KotlinTypes.INT.value:
-                    self.semantic_error_listener.semantic_error(
-                        msg = f"Cannot apply multiplicative operator to operands of type '{left_type}' and '{right_type}' in expression '{ctx.getText()}'", 
-                        line = ctx.start.line, 
-                        column = ctx.start.column
-                    )
-                    return "None"
-            return KotlinTypes.INT.value
-        return left_type
+        while not isinstance(ctx, KotlinParser.PrimaryExpressionContext) and ctx.getChildCount() == 1:
+            ctx = ctx.getChild(0)
+        return self.expression_type_checkers[type(ctx)](self, ctx)
 
 
     def check_unary_expression_type(self, ctx):
@@ -1768,30 +1817,23 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: The type of the expression if valid; otherwise, 'None' if there is a type mismatch.
         """
-        print(f"    🔍 Checking the type of the unary expression {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the type of the unary expression %s.", self.get_text(ctx))
         
-        if ctx.NOT(): 
-            expr_type = self.check_primary_expression_type(ctx.primaryExpression())  
-            if expr_type != KotlinTypes.BOOLEAN.value:
-                self.semantic_error_listener.semantic_error(
-                    msg = f"Cannot apply operator '{ctx.NOT().getText()}' to operands of type '{expr_type}' in expression '{ctx.getText()}'", 
-                    line = ctx.start.line, 
-                    column = ctx.start.column
-                )
-                return "None"
-            return expr_type
-        elif ctx.MINUS():  
-            expr_type = self.check_primary_expression_type(ctx.primaryExpression())  
-            if expr_type != KotlinTypes.INT.value:
+        # Either a NOT/MINUS operator token followed by a primary expression, or a membership expression
+        first = ctx.getChild(0)
+        if isinstance(first, TerminalNode):
+            expr_type = self.check_primary_expression_type(ctx.getChild(1))  
+            if expr_type != self.unary_operand_types[first.getSymbol().type]:
                 self.semantic_error_listener.semantic_error(
-                    msg = f"Cannot apply operator '{ctx.MINUS().getText()}' to operands of type '{expr_type}' in expression '{ctx.getText()}'", 
+                    msg = f"Cannot apply operator '{first.getText()}' to operands of type '{expr_type}' in expression '{self.get_text(ctx)}'", 
                     line = ctx.start.line, 
                     column = ctx.start.column
                 )
                 return "None"
             return expr_type
         else:
-            return self.check_membership_expression_type(ctx.membershipExpression())
+            return self.check_membership_expression_type(first)
 
 
     def check_membership_expression_type(self, ctx):
@@ -1805,46 +1847,48 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: The type of the expression if valid, otherwise returns 'None' for type mismatches.
         """
-        print(f"    🔍 Checking the type of the membership expression {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the type of the membership expression %s.", self.get_text(ctx))
         
-        if ctx.rangeExpression():
-            if ctx.primaryExpression().IDENTIFIER():
-                identifier = ctx.primaryExpression().IDENTIFIER()
-                var_name = self.visit_identifier(identifier)
+        primary = ctx.getChild(0)
+        # The range, if any, is the last child, after the 'in' or '!in' operator tokens
+        if ctx.getChildCount() > 1:
+            line, column = ctx.start.line, ctx.start.column
+            identifier = primary.getChild(0)
+            if isinstance(identifier, TerminalNode) and identifier.getSymbol().type == KotlinParser.IDENTIFIER:
+                var_name = self.get_identifier_name(identifier)
             
-                if not self.check_variable_already_declared(ctx, var_name): 
-                    return "None"
-                elif not self.check_variable_already_assigned(ctx=ctx, var_name=var_name):
+                # Reports the variable as undeclared or unassigned, otherwise returns its symbol
+                if not (variable := self.check_variable_already_assigned(ctx=ctx, var_name=var_name)):
                     return "None"
                 else:
-                    left_type = self.check_primary_expression_type(ctx.primaryExpression())
-                    var_type, is_mutable = self.symbol_table.get_variable_info(var_name)
-                    if var_type != KotlinTypes.INT.value:
+                    left_type, is_mutable = variable.type, variable.mutable
+                    if left_type != KOTLIN_INT:
                         self.semantic_error_listener.semantic_error(
                             msg = f"The left-hand side of the 'in' operator must be Int, found {left_type} instead.", 
-                            line = ctx.start.line, 
-                            column = ctx.start.column
+                            line = line, 
+                            column = column
                         )
                         return left_type
                     if is_mutable == False:
                         self.semantic_error_listener.semantic_error(
-                            msg = f"The left-hand side of the 'in' operator must be mutable.", 
-                            line = ctx.start.line, 
-                            column = ctx.start.column
+                            msg = "The left-hand side of the 'in' operator must be mutable.", 
+                            line = line, 
+                            column = column
                         )
                         return left_type
-                    self.check_range_expression_type(ctx.rangeExpression())
-                    return KotlinTypes.BOOLEAN.value 
+                    self.check_range_expression_type(ctx.getChild(ctx.getChildCount() - 1))
+                    return KOTLIN_BOOLEAN 
             else:
-                left_type = self.check_primary_expression_type(ctx.primaryExpression())
+                left_type = self.check_primary_expression_type(primary)
                 self.semantic_error_listener.semantic_error(
-                    msg = f"The left-hand side of the 'in' operator must be a variable.", 
-                    line = ctx.start.line, 
-                    column = ctx.start.column
+                    msg = "The left-hand side of the 'in' operator must be a variable.", 
+                    line = line, 
+                    column = column
                 )
                 return left_type
         else:
-            left_type = self.check_primary_expression_type(ctx.primaryExpression())
+            left_type = self.check_primary_expression_type(primary)
             return left_type
     
 
@@ -1860,25 +1904,28 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             str: Returns the type of the left operand if valid, otherwise returns 'None'
                  to indicate type errors.
         """
-        print(f"    🔍 Checking the type of the range expression {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the type of the range expression %s.", self.get_text(ctx))
         
-        left_type = self.check_additive_expression_type(ctx.additiveExpression(0))
+        line, column = ctx.start.line, ctx.start.column
+        operands = ctx.additiveExpression()
+        left_type = self.check_operand_type(operands[0])
         
-        if not ctx.additiveExpression(1):
+        if len(operands) < 2:
             self.semantic_error_listener.semantic_error(
                 msg = f"The for loop requires a range in the iteration condition, but found {left_type}.",
-                line = ctx.start.line, 
-                column = ctx.start.column
+                line = line, 
+                column = column
             )
             return "None"
 
-        right_type = self.check_additive_expression_type(ctx.additiveExpression(1))
+        right_type = self.check_operand_type(operands[1])
         
-        if left_type != KotlinTypes.INT.value or right_type != KotlinTypes.INT.value:
+        if left_type != KOTLIN_INT or right_type != KOTLIN_INT:
             self.semantic_error_listener.semantic_error(
                 msg = f"The range operator '..' is only supported for Int types, found {left_type} and {right_type} instead.", 
-                line = ctx.start.line, 
-                column = ctx.start.column
+                line = line, 
+                column = column
             )
             return "None"
         
@@ -1896,27 +1943,30 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: The type of the expression if valid, otherwise returns 'None' to indicate errors.
         """
-        print(f"    🔍 Checking the type of the primary expression {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the type of the primary expression %s.", self.get_text(ctx))
         
-        if ctx.IDENTIFIER():
-            identifier = self.visit_identifier(ctx.IDENTIFIER())        
-            if not self.check_variable_already_declared(ctx=ctx, var_name=identifier):        
-                return "None"
+        # The first child alone tells which alternative of the rule was matched
+        first = ctx.getChild(0)
+        token_type = first.getSymbol().type if isinstance(first, TerminalNode) else None
+        if token_type == KotlinParser.IDENTIFIER:
+            identifier = self.get_identifier_name(first)
 
-            if not self.check_variable_already_assigned(ctx=ctx, var_name=identifier):
+            # Reports the variable as undeclared or unassigned, otherwise returns its symbol
+            variable = self.check_variable_already_assigned(ctx=ctx, var_name=identifier)
+            if not variable:
                 return "None"
             
-            var_type, _ = self.symbol_table.get_variable_info(identifier)
-            return var_type
-        elif ctx.LEFT_ROUND_BRACKET() and ctx.RIGHT_ROUND_BRACKET():
-            return self.check_expression_type(ctx=ctx.expression())
-        elif ctx.literal():
-            return self.check_literal_type(ctx=ctx.literal())
-        elif ctx.callExpression():
-            return self.check_call_expression(ctx.callExpression())
+            return variable.type
+        elif token_type == KotlinParser.LEFT_ROUND_BRACKET:
+            return self.check_expression_type(ctx=ctx.getChild(1))
+        elif isinstance(first, KotlinParser.LiteralContext):
+            return self.check_literal_type(ctx=first)
+        elif isinstance(first, KotlinParser.CallExpressionContext):
+            return self.check_call_expression(first)
         else:
             self.semantic_error_listener.semantic_error(
-                msg = f"Unsupported expression type for expression '{ctx.getText()}'.", 
+                msg = f"Unsupported expression type for expression '{self.get_text(ctx)}'.", 
                 line = ctx.start.line, 
                 column = ctx.start.column
             )
@@ -1926,6 +1976,9 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
     def check_literal_type(self, ctx):
         """
         Checks the type of the literal expression (e.g., Int, String, Boolean, etc.).
+
+        The type is taken from the alternative matched by the parser (the token type of an integer 
+        or string literal, or a boolean literal rule) instead of re-scanning the literal text.
         
         Args:
             ctx: The context representing the literal in the ANTLR parse tree.
@@ -1934,39 +1987,49 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             str: The type of the literal expression if valid, otherwise returns 'None' 
                  to indicate errors.
         """
-        print(f"    🔍 Checking the type of the literal expression {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the type of the literal expression %s.", self.get_text(ctx))
         
-        literal = ctx.getText()
-        if literal.isdigit():
-            return KotlinTypes.INT.value
-        elif literal.startswith('"') and literal.endswith('"'): 
-            return KotlinTypes.STRING.value
-        elif literal == 'true' or literal == 'false':
-            return KotlinTypes.BOOLEAN.value
+        literal = ctx.getChild(0)
+        if isinstance(literal, TerminalNode):
+            literal_type = self.literal_token_types.get(literal.getSymbol().type)
+        elif isinstance(literal, KotlinParser.BooleanLiteralContext):
+            literal_type = KOTLIN_BOOLEAN
         else:
+            literal_type = None
+
+        if literal_type is None:
             self.semantic_error_listener.semantic_error(
-                msg = f"Unsupported expression type for variable '{literal}'.", 
+                msg = f"Unsupported expression type for variable '{self.get_text(ctx)}'.", 
                 line = ctx.start.line, 
                 column = ctx.start.column
             )
             return "None"
+        return literal_type
 
 
-    def check_parameter_type_list(self, ctx):
+    def check_parameter_list(self, ctx):
         """
-        Checks the types of a list of parameters and returns a comma-separated string 
-        of valid types.
+        Checks the names and types of a list of parameters in a single pass.
+
+        Each parameter is read once, and callers take the projection they need (e.g., the 
+        comma-separated types of the function signature) from the returned tuples.
 
         Args:
             ctx: The context representing the parameter list in the ANTLR parse tree.
 
         Returns:
-            str: A comma-separated list of parameter types if valid, otherwise returns None 
-                 to indicate errors.
+            list: A list of (name, type, default) tuples, one per parameter, where name is None 
+                  if it is a reserved keyword, type is None if it is unsupported, and default is 
+                  the context of the default value expression, or None if there is none.
         """
-        print(f"    🔍 Checking the type of the parameters list {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the parameters list %s.", self.get_text(ctx))
         
-        return ", ".join([self.check_parameter_type(param) for param in ctx.parameter() if self.check_parameter_type(param) is not None])
+        return [
+            (self.check_parameter_name(param), self.check_parameter_type(param), param.expression()) 
+            for param in ctx.parameter()
+        ]
 
 
     def check_parameter_type(self, ctx):      
@@ -1979,38 +2042,34 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: The parameter type if supported, otherwise None.
         """
-        print(f"    🔍 Checking the type of the parameter {ctx.getText()}.")  
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the type of the parameter %s.", self.get_text(ctx))
         
-        kotlin_param_type = ctx.type_().getText()
+        kotlin_param_type, _ = self.resolve_type(ctx.type_())
         if not self.check_supported_type(ctx=ctx, type=kotlin_param_type):
             return None
         return kotlin_param_type
     
     
-    def check_duplicate_parameters(self, ctx, fun_name):
+    def check_duplicate_parameters(self, ctx, fun_name, param_names):
         """
         Checks if a function has duplicate parameters.
 
         Args:
-            ctx: The context representing the function declaration in the ANTLR parse tree.
+            ctx: The context representing the parameter list in the ANTLR parse tree.
             fun_name: The name of the function being checked.
+            param_names (tuple): The valid parameter names, in declaration order.
         
         Returns:
             bool: True if no duplicates are found, False otherwise.
         """
-        print(f"    🔍 Checking for duplicate parameters in function {fun_name}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking for duplicate parameters in function %s.", fun_name)
         
-        parameter_list = [param.strip() for param in self.check_parameter_name_list(ctx).split(", ")]
-        params_seen = set() # non-duplicated params
-        duplicate_params = []
-
-        for param in parameter_list:
-            if param in params_seen:
-                duplicate_params.append(param)
-            else:
-                params_seen.add(param)
-        if duplicate_params:
-            duplicates = ", ".join(duplicate_params)
+        # Counted in a single pass; names are listed once, in order of first appearance
+        param_counts = Counter(param_names)
+        if len(param_counts) != len(param_names):
+            duplicates = ", ".join(param for param, count in param_counts.items() if count > 1)
             self.semantic_error_listener.semantic_error(
                 msg = f"Function '{fun_name}' has duplicate parameters: {duplicates}.",
                 line = ctx.start.line,
@@ -2021,21 +2080,6 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         return True
 
 
-    def check_parameter_name_list(self, ctx):
-        """
-        Checks and returns the list of parameter names from the function's parameter list.
-
-        Args:
-            ctx: The context representing the function declaration in the ANTLR parse tree.
-        
-        Returns:
-            str: A comma-separated list of parameter names. 
-        """
-        print(f"    🔍 Checking the name of the parameters list {ctx.getText()}.")
-        
-        return ", ".join([self.check_parameter_name(param) for param in ctx.parameter()])
-
-
     def check_parameter_name(self, ctx):    
         """
         Checks the name of the parameter and returns the parameter name.
@@ -2044,72 +2088,42 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             ctx: The context representing a parameter in the ANTLR parse tree.
         
         Returns:
-            str: The parameter name.
+            str: The parameter name, or None if it is a reserved keyword.
         """
-        print(f"    🔍 Checking the name of the parameter {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the name of the parameter %s.", self.get_text(ctx))
         
         param_name = self.visit_identifier(ctx.IDENTIFIER())
         return param_name
     
 
-    def check_parameter_name_value_list(self, ctx):
-        """
-        Checks the value of the parameters list and returns a comma-separated string 
-        of valid parameter names and values.
-        
-        Args:
-            ctx: The context representing a list of parameters in the ANTLR parse tree.
-        
-        Returns:
-            str: A comma-separated list of valid parameter names and values.
-        """
-        print(f"    🔍 Checking the value of the parameters list {ctx.getText()}.")
-        
-        return ", ".join([self.check_parameter_name_value(param) for param in ctx.parameter() if self.check_parameter_name_value(param) is not None])
-
-
-    def check_parameter_name_value(self, ctx):   
-        """
-        Checks and returns the name and value of the parameter, 
-        formatted as 'name: value'. If no value is provided, it returns 
-        'name: None'.
-        
-        Args:
-            ctx: The context representing the parameter in the ANTLR parse tree.
-        
-        Returns:
-            str: A formatted string representing the parameter name and its value.
-        """
-        print(f"    🔍 Checking the value of the parameter {ctx.getText()}.")    
-        
-        param_name = self.visit_identifier(ctx.IDENTIFIER())
-        param_value = self.visit_expression(ctx.expression()) if (ctx.expression()) else None 
-        return f"{param_name}: {param_value}"
-    
-
-    def check_function_not_declared_in_current_scope(self, ctx, fun_name, argument_types):
+    def check_function_declared(self, ctx, fun_name, argument_types):
         """
-        Checks if a function is called before its declaration in the current scope.
+        Checks that a called function is declared with a matching signature, reporting a semantic 
+        error if it is called before its declaration.
         
         Args:
             ctx: The context of the function call.
             fun_name: The name of the function being called.
-            argument_types: A list of argument types used in the function call.
+            argument_types (tuple): The argument types used in the function call.
 
         Returns:
-            bool: True if the function is not declared in the current scope, False otherwise.
+            dict: The matching function version found in the symbol table, so that callers can read 
+                  its return type without looking it up again; otherwise, None.
         """
-        print(f"    🔍 Checking if function {fun_name} is not declared in currrent scope.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking if function %s is declared.", fun_name)
         
-        if not self.symbol_table.lookup_function(fun_name, argument_types):
+        function = self.symbol_table.lookup_function(fun_name, argument_types)
+        if not function:
             self.semantic_error_listener.semantic_error(
-                msg = f"Trying to call function '{fun_name}' with signature '{argument_types}' before its declaration." if argument_types 
+                msg = f"Trying to call function '{fun_name}' with signature '{', '.join(argument_types)}' before its declaration." if argument_types 
                         else f"Trying to call function '{fun_name}' before its declaration.", 
                 line = ctx.start.line, 
                 column = ctx.start.column
             )
-            return True
-        return False
+            return None
+        return function
 
 
     def check_function_already_declared_in_current_scope(self, ctx, fun_name, kotlin_param_types):
@@ -2120,16 +2134,17 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Args:
             ctx: The context of the function declaration or call.
             fun_name: The name of the function.
-            kotlin_param_types: The list of parameter types for the function.
+            kotlin_param_types (tuple): The parameter types of the function.
 
         Returns:
             bool: True if the function is already declared in the current scope, False otherwise.
         """
-        print(f"    🔍 Checking if function {fun_name} is already declared in currrent scope.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking if function %s is already declared in currrent scope.", fun_name)
         
         if self.symbol_table.lookup_function(fun_name, kotlin_param_types):
             self.semantic_error_listener.semantic_error(
-                msg = f"Function '{fun_name}' with signature '{kotlin_param_types}' is already declared in the current scope." if kotlin_param_types
+                msg = f"Function '{fun_name}' with signature '{', '.join(kotlin_param_types)}' is already declared in the current scope." if kotlin_param_types
                         else f"Function '{fun_name}' is already declared in the current scope.", 
                 line = ctx.start.line, 
                 column = ctx.start.column
@@ -2142,7 +2157,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         """
         Checks that a function call is properly declared and matches the expected signature. It 
         retrieves the function name and arguments from the context, verifies the function's existence 
-        and signature, and determines its return type.
+        and signature, and determines its return type. The return type is stored on the context, so 
+        the type check of an expression and the translation of the call share a single check.
         
         Args:
             ctx: Parser context for the function call.
@@ -2155,16 +2171,20 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             2. Checks if the function is declared with the correct signature.
             3. Returns the function's return type or logs an error if undefined.
         """
-        print(f"    🔍 Checking call expression {ctx.getText()}.")
-        
-        fun_name = ctx.IDENTIFIER().getText()
-        argument_types = self.check_argument_type_list(ctx.argumentList()) if ctx.argumentList() else None
+        return_type = getattr(ctx, "kotlin_type", None)
+        if return_type is not None:
+            return return_type
 
-        if self.check_function_not_declared_in_current_scope(ctx, fun_name, argument_types):
-            return "None"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking call expression %s.", self.get_text(ctx))
         
-        return_type = self.symbol_table.get_function_return_type(fun_name, argument_types)        
+        fun_name = self.get_identifier_name(ctx.IDENTIFIER())
+        argument_types = self.check_argument_type_list(argument_list) if (argument_list := ctx.argumentList()) else ()
+
+        function = self.check_function_declared(ctx, fun_name, argument_types)
+        return_type = function.return_type if function else "None"
         
+        ctx.kotlin_type = return_type
         return return_type
     
     
@@ -2173,17 +2193,19 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Checks the types of the arguments in a function call expression.
 
         This method iterates over the arguments in the function call and checks the type of each argument 
-        using the `check_argument_type` method. It returns a comma-separated list of argument types.
+        using the `check_argument_type` method. It returns the argument types as a tuple, which is 
+        compared directly with the parameter types stored in the symbol table.
 
         Args:
             ctx: The context of the argument list in the function call expression.
 
         Returns:
-            str: A comma-separated list of argument types for the function call.
+            tuple: The argument types for the function call.
         """
-        print(f"    🔍 Checking the type of the arguments list {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the type of the arguments list %s.", self.get_text(ctx))
         
-        return ", ".join([self.check_argument_type(argument) for argument in ctx.argument()])       
+        return tuple([self.check_argument_type(argument) for argument in ctx.argument()])       
     
 
     def check_argument_type(self, ctx):
@@ -2199,28 +2221,34 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: The type of the argument.
         """
-        print(f"    🔍 Checking the type of the argument {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the type of the argument %s.", self.get_text(ctx))
         
         return self.check_expression_type(ctx.expression())
 
 
-    def check_argument_name_list(self, ctx):
+    def check_argument_type_and_name_list(self, ctx):
         """
-        Checks the names of the arguments in a function call.
+        Checks the types and the names of the arguments in a function call.
 
-        This method retrieves and checks the names of all the arguments in the list of arguments 
-        passed to a function call. It returns a string with the names of all arguments, separated 
-        by commas.
+        This method walks the list of arguments passed to a function call once, checking the type 
+        and retrieving the name of each argument. Both are returned as tuples, which are compared 
+        directly with the parameter types and names stored in the symbol table.
 
         Args:
             ctx: The context of the argument list in the function call expression.
 
         Returns:
-            str: A comma-separated list of the argument names.
+            tuple: A tuple (argument_types, argument_names) for the function call.
         """
-        print(f"    🔍 Checking the name of the arguments list {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the type and the name of the arguments list %s.", self.get_text(ctx))
         
-        return ", ".join([self.check_argument_name(argument) for argument in ctx.argument()])       
+        argument_types, argument_names = [], []
+        for argument in ctx.argument():
+            argument_types.append(self.check_argument_type(argument))
+            argument_names.append(self.check_argument_name(argument))
+        return tuple(argument_types), tuple(argument_names)       
     
 
     def check_argument_name(self, ctx):
@@ -2236,10 +2264,11 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             str: The name of the argument, or "None" if no identifier is found.
         """
-        print(f"    🔍 Checking the name of the argument {ctx.getText()}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the name of the argument %s.", self.get_text(ctx))
         
-        argument_name = self.visit_identifier(ctx.IDENTIFIER()) if (ctx.IDENTIFIER()) else "None"
-        return argument_name
+        identifier = ctx.IDENTIFIER()
+        return self.get_identifier_name(identifier) if identifier else "None"
 
 
     def check_return_statement(self, ctx, fun_name, fun_return_type):
@@ -2262,16 +2291,19 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             bool: `True` if the return statement is valid, `False` otherwise.
         """
-        print(f"    🔍 Checking the return statement of the function {fun_name}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the return statement of the function %s.", fun_name)
         
         # Iterate over all statements in the function body and check for return statements
+        line, column = ctx.start.line, ctx.start.column
+        statements = ctx.statement()
         if fun_return_type:
-            if not ctx.statement():
+            if not statements:
                 # If no return statement is found and a return type is expected
                 self.semantic_error_listener.semantic_error(
                     msg = f"Function '{fun_name}' must have a return statement.", 
-                    line = ctx.start.line, 
-                    column = ctx.start.column
+                    line = line, 
+                    column = column
                 )
                 return False
             else:      
@@ -2279,15 +2311,13 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                 valid_return_stmt_in_for = False
                 valid_return_stmt_in_if_else = False
                 
-                for stmt in ctx.statement():
-                    if stmt.returnStatement():
-                        return_stmt = stmt.returnStatement()
+                # A statement matches a single alternative, so each one is classified once
+                for stmt in statements:
+                    if return_stmt := stmt.returnStatement():
                         valid_return_stmt = self.validate_return_statement(return_stmt, fun_name, fun_return_type) 
-                    if stmt.forStatement():
-                        for_stmt = stmt.forStatement()
+                    elif for_stmt := stmt.forStatement():
                         valid_return_stmt_in_for = self.check_return_statement_in_for_statement(for_stmt, fun_name, fun_return_type) 
-                    if stmt.ifElseStatement():
-                        if_stmt = stmt.ifElseStatement()
+                    elif if_stmt := stmt.ifElseStatement():
                         valid_return_stmt_in_if_else = self.check_return_statement_in_if_else_statement(if_stmt, fun_name, fun_return_type) 
                 
                 if valid_return_stmt or valid_return_stmt_in_for or valid_return_stmt_in_if_else:
@@ -2296,8 +2326,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
                     # Return statement not valid
                     self.semantic_error_listener.semantic_error(
                         msg = f"Function '{fun_name}' must have a valid return statement.", 
-                        line = ctx.start.line, 
-                        column = ctx.start.column
+                        line = line, 
+                        column = column
                     )
                     return False
         else:
@@ -2305,19 +2335,13 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             no_return_stmt_in_for = True
             no__return_stmt_in_if_else = True
     
-            for stmt in ctx.statement():
+            for stmt in statements:
                 if stmt.returnStatement():
-                    self.semantic_error_listener.semantic_error(
-                        msg = f"Function '{fun_name}' has no return type, but includes a return statement.", 
-                        line = ctx.start.line,  
-                        column = ctx.start.column
-                    )
+                    self.report_unexpected_return_statement(fun_name, line, column)
                     no_return_stmt = False
-                if stmt.forStatement():
-                    for_stmt = stmt.forStatement()
+                elif for_stmt := stmt.forStatement():
                     no_return_stmt_in_for = self.check_no_return_statement_in_for_statement(for_stmt, fun_name)
-                if stmt.ifElseStatement():
-                    if_stmt = stmt.ifElseStatement()
+                elif if_stmt := stmt.ifElseStatement():
                     no__return_stmt_in_if_else = self.check_no_return_statement_in_if_else_statement(if_stmt, fun_name)
             
             return no_return_stmt and no_return_stmt_in_for and no__return_stmt_in_if_else 
@@ -2338,7 +2362,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             bool: `True` if the return statement within the `for` loop is valid, `False` otherwise.
         """
-        print(f"    🔍 Checking the return statement of the function {fun_name} in for statement.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the return statement of the function %s in for statement.", fun_name)
         
         if ctx.block(): 
             block = ctx.block()
@@ -2372,7 +2397,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             bool: `True` if all return statements in the `if` and `else` branches are valid, 
                   `False` otherwise.
         """
-        print(f"    🔍 Checking the return statement of the function {fun_name} in if-else statement.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the return statement of the function %s in if-else statement.", fun_name)
         
         if_body = ctx.ifBody()
         check_if = self.check_return_statement_in_if_else_body(if_body, fun_name, fun_return_type)
@@ -2403,7 +2429,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             bool: `True` if a valid return statement is found in the body, 
                   `False` if no return statement is found and an error is raised.
         """
-        print(f"    🔍 Checking the return statement of the function {fun_name} in if-else body.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking the return statement of the function %s in if-else body.", fun_name)
         
         if ctx.block(): 
             block = ctx.block()
@@ -2437,28 +2464,10 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             bool: `True` if no return statement is found in the `for` loop (or it is correctly handled), 
                   `False` if a return statement is found and an error is raised.
         """
-        print(f"    🔍 Checking missing return statement of the function {fun_name} in for statement.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking missing return statement of the function %s in for statement.", fun_name)
         
-        if ctx.block(): 
-            block = ctx.block()
-            for stmt in block.statement():
-                if stmt.returnStatement():
-                    self.semantic_error_listener.semantic_error(
-                        msg = f"Function '{fun_name}' has no return type, but includes a return statement.", 
-                        line = ctx.start.line,  
-                        column = ctx.start.column
-                    )
-                    return False
-        else:  
-            stmt = ctx.statement()
-            if stmt.returnStatement():
-                    self.semantic_error_listener.semantic_error(
-                        msg = f"Function '{fun_name}' has no return type, but includes a return statement.", 
-                        line = ctx.start.line,  
-                        column = ctx.start.column
-                    )
-                    return False
-        return True  
+        return self.check_no_return_statement_in_body(ctx, fun_name)
 
 
     def check_no_return_statement_in_if_else_statement(self, ctx, fun_name): 
@@ -2478,7 +2487,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             bool: `True` if no return statement is found in the `if` and `else` bodies (or it is 
                   correctly handled), `False` if a return statement is found and an error is raised.
         """
-        print(f"    🔍 Checking missing return statement of the function {fun_name} in if-else statement.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking missing return statement of the function %s in if-else statement.", fun_name)
         
         if_body = ctx.ifBody()
         check_if = self.check_no_return_statement_in_if_else_body(if_body, fun_name)
@@ -2507,28 +2517,46 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             bool: `True` if no return statement is found (or correctly handled), 
                 `False` if a return statement is found and an error is raised.
         """
-        print(f"    🔍 Checking missing return statement of the function {fun_name} in if-else body.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking missing return statement of the function %s in if-else body.", fun_name)
         
-        if ctx.block(): 
-            block = ctx.block()
-            for stmt in block.statement():
-                if stmt.returnStatement():
-                    self.semantic_error_listener.semantic_error(
-                        msg = f"Function '{fun_name}' has no return type, but includes a return statement.", 
-                        line = ctx.start.line,  
-                        column = ctx.start.column
-                    )
-                    return False
-        else:  
-            stmt = ctx.statement()
+        return self.check_no_return_statement_in_body(ctx, fun_name)
+
+
+    def check_no_return_statement_in_body(self, ctx, fun_name):
+        """
+        Ensures that the body of a `for` loop or of an `if-else` branch, either a block or a single 
+        statement, does not contain any return statements.
+
+        Args:
+            ctx: The context owning the body (a `for` statement, an `if` body or an `else` body).
+            fun_name: The name of the function being checked.
+
+        Returns:
+            bool: `True` if no return statement is found, `False` if one is found and an error is raised.
+        """
+        statements = block.statement() if (block := ctx.block()) else [ctx.statement()]
+        for stmt in statements:
             if stmt.returnStatement():
-                self.semantic_error_listener.semantic_error(
-                    msg = f"Function '{fun_name}' has no return type, but includes a return statement.", 
-                    line = ctx.start.line,  
-                    column = ctx.start.column
-                )
+                self.report_unexpected_return_statement(fun_name, ctx.start.line, ctx.start.column)
                 return False
-        return True  
+        return True
+
+
+    def report_unexpected_return_statement(self, fun_name, line, column):
+        """
+        Reports a return statement found in a function that has no return type.
+
+        Args:
+            fun_name: The name of the function being checked.
+            line: The line where the error is reported.
+            column: The column where the error is reported.
+        """
+        self.semantic_error_listener.semantic_error(
+            msg = f"Function '{fun_name}' has no return type, but includes a return statement.", 
+            line = line,  
+            column = column
+        )
 
 
     def validate_return_statement(self, ctx, fun_name, fun_return_type):
@@ -2548,7 +2576,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             bool: `True` if the return statement is valid, `False` if an error is found (either due to 
                   a type mismatch or a missing return expression).
         """
-        print(f"    🔍 Validating return statement of the function {fun_name}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Validating return statement of the function %s.", fun_name)
         
         return_expression = ctx.expression()
         if return_expression:
@@ -2576,6 +2605,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Checks the validity of the arguments for a function by verifying both their types and names.
 
         This method checks if the arguments of the function match the expected types and names. 
+        The argument list is walked once for both checks, and the versions of the function found 
+        while checking the types are reused to check the names.
 
         Args:
             ctx: The context representing the arguments in the Parse Tree.
@@ -2584,12 +2615,15 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             bool: `True` if both argument types and names are valid, `False` if any issue is found.
         """
-        print(f"    🔍 Checking arguments of function {fun_name}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking arguments of function %s.", fun_name)
         
-        return (self.check_argument_types(ctx, fun_name) and self.check_argument_names(ctx, fun_name))
+        argument_types, argument_names = self.check_argument_type_and_name_list(ctx.argumentList())
+        function_versions = self.check_argument_types(ctx, fun_name, argument_types)
+        return bool(function_versions) and self.check_argument_names(ctx, fun_name, argument_names, function_versions)
 
 
-    def check_argument_types(self, ctx, fun_name):
+    def check_argument_types(self, ctx, fun_name, argument_types):
         """
         Checks if the argument types in the function call match the expected parameter types 
         for that function.
@@ -2601,54 +2635,41 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Args:
             ctx: The context representing the function call and its argument list in the Parse Tree.
             fun_name: The name of the function being called.
+            argument_types (tuple): The types of the arguments of the function call.
 
         Returns:
-            bool: `True` if the argument types match a declared function signature, `False` otherwise.
+            dict: The versions of the function if the argument types match one of their signatures, 
+                  `False` otherwise.
         """
-        print(f"    🔍 Checking types of arguments of the function {fun_name}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking types of arguments of the function %s.", fun_name)
         
-        argument_types = self.check_argument_type_list(ctx.argumentList()) 
-        
-        if self.check_function_not_declared_in_current_scope(ctx = ctx, fun_name = fun_name, argument_types=argument_types):        
+        if not self.check_function_declared(ctx = ctx, fun_name = fun_name, argument_types=argument_types):        
             return False
         function_versions = self.symbol_table.get_function_params(fun_name)
         
         if not function_versions:
             self.semantic_error_listener.semantic_error(
-                msg = f"Function '{fun_name}' with argument types {argument_types} is not declared in any scope.",
+                msg = f"Function '{fun_name}' with argument types {', '.join(argument_types)} is not declared in any scope.",
                 line = ctx.start.line,
                 column = ctx.start.column,
             )
             return False            
         
-        # Check if there is a version of the function that matches the provided arguments
-        for fun in function_versions:
-            param_types = fun["param_types"]
-            
-            # Check if the number of parameters matches
-            if len(param_types) != len(argument_types):
-                continue  # They don't match, try the next version of the function
-
-            # Check if the parameter types match
-            match = True
-            for param_type, arg_type in zip(param_types, argument_types):
-                if param_type != arg_type:
-                    match = False
-                    break
-            
-            if match:
-                return True  # Found a match
+        # Check if there is a version of the function with as many parameters whose signature matches the provided arguments
+        if argument_types in function_versions.get(len(argument_types), ()):
+            return function_versions  # Found a match
 
         # If no matches are found
         self.semantic_error_listener.semantic_error(
-            msg = f"Function '{fun_name}' with argument types {argument_types} does not match any signature in the current scope.",
+            msg = f"Function '{fun_name}' with argument types {', '.join(argument_types)} does not match any signature in the current scope.",
             line = ctx.start.line,
             column = ctx.start.column,
         )
         return False 
  
 
-    def check_argument_names(self, ctx, fun_name):
+    def check_argument_names(self, ctx, fun_name, argument_names, function_versions):
         """
         Checks if the argument names in the function call match the expected parameter names 
         for that function.
@@ -2660,49 +2681,42 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Args:
             ctx: The context representing the function call and its argument list in the Parse Tree.
             fun_name: The name of the function being called.
+            argument_names (tuple): The names of the arguments of the function call, "None" for 
+                                    the unnamed ones.
+            function_versions (dict): The versions of the function declared in the active scopes, 
+                                      grouped by number of parameters and keyed by their parameter types.
 
         Returns:
             bool: `True` if the argument names match a declared function signature, `False` otherwise.
         """
-        print(f"    🔍 Checking names of arguments of the function {fun_name}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking names of arguments of the function %s.", fun_name)
         
-        argument_names = self.check_argument_name_list(ctx.argumentList())
-        argument_names_list = argument_names.split(", ")
-
-        function_versions = self.symbol_table.get_function_params(fun_name)    
-
         if not function_versions:
             self.semantic_error_listener.semantic_error(
-                msg = f"Function '{fun_name}' with argument names {argument_names} is not declared in any scope.",
+                msg = f"Function '{fun_name}' with argument names {', '.join(argument_names)} is not declared in any scope.",
                 line = ctx.start.line,
                 column = ctx.start.column,
             )
             return False            
 
         # Check if there is a version of the function that matches the provided argument names
-        for fun in function_versions:
+        # Only the versions with as many parameters as the provided arguments are visited
+        for fun in function_versions.get(len(argument_names), {}).values():
 
-            param_names = fun["param_names"]  # Assuming you have stored parameter names in the function definitions
-            param_names_list = param_names.split(", ")
+            param_names = fun.param_names
 
-            # Check if the number of parameters matches
-            if len(param_names_list) != len(argument_names_list):
-                continue  # They don't match, try the next version of the function
-            
-            # Check if the parameter names match
-            match = True
+            # Every argument is named after its parameter: a single tuple comparison is enough
+            if param_names == argument_names:
+                return True
 
-            for param_name, arg_name in zip(param_names_list, argument_names_list):
-                if arg_name != "None" and param_name != arg_name:
-                    match = False
-                    break
-            
-            if match:
+            # Check if the parameter names match, skipping the unnamed arguments
+            if all(arg_name == "None" or param_name == arg_name for param_name, arg_name in zip(param_names, argument_names)):
                 return True  # Found a match
         
         # If no matches are found
         self.semantic_error_listener.semantic_error(
-            msg = f"Function '{fun_name}' with argument names {argument_names} does not match any signature in the current scope.",
+            msg = f"Function '{fun_name}' with argument names {', '.join(argument_names)} does not match any signature in the current scope.",
             line = ctx.start.line,
             column = ctx.start.column,
         )
@@ -2725,7 +2739,8 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
         Returns:
             bool: `True` if the class is already declared in the current scope, `False` otherwise.
         """
-        print(f"    🔍 Checking if class {class_name} is already declared in the current scope.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    🔍 Checking if class %s is already declared in the current scope.", class_name)
         
         if self.symbol_table.lookup_class(class_name):
             self.semantic_error_listener.semantic_error(
@@ -2735,4 +2750,69 @@ class KotlinToSwiftVisitor(ParseTreeVisitor):
             )
             return True
         return False
-    
\ No newline at end of file
+
+
+    ##### DISPATCH TABLES #####
+
+
+    # Built once at class creation from the plain functions above; callers pass `self` explicitly.
+    top_level_statement_visitors = {
+        KotlinParser.ClassDeclarationContext: visit_class_declaration,
+        KotlinParser.CommentStatementContext: visit_comment_statement
+    }
+
+    statement_visitors = {
+        KotlinParser.ReadStatementContext: visit_read_statement,
+        KotlinParser.PrintStatementContext: visit_print_statement,
+        KotlinParser.IfElseStatementContext: visit_if_else_statement,
+        KotlinParser.ForStatementContext: visit_for_statement,
+        KotlinParser.AssignmentStatementContext: visit_assignment_statement,
+        KotlinParser.VarDeclarationContext: visit_var_declaration,
+        KotlinParser.ReturnStatementContext: visit_return_statement,
+        KotlinParser.CommentStatementContext: visit_comment_statement
+    }
+
+    class_body_visitors = {
+        KotlinParser.VarDeclarationContext: visit_var_declaration,
+        KotlinParser.FunctionDeclarationContext: visit_function_declaration,
+        KotlinParser.AssignmentStatementContext: visit_assignment_statement,
+        KotlinParser.CommentStatementContext: visit_comment_statement
+    }
+
+    binary_expression_types = (
+        KotlinParser.LogicalOrExpressionContext,
+        KotlinParser.LogicalAndExpressionContext,
+        KotlinParser.EqualityExpressionContext,
+        KotlinParser.RelationalExpressionContext,
+        KotlinParser.AdditiveExpressionContext,
+        KotlinParser.MultiplicativeExpressionContext
+    )
+
+    expression_visitors = {
+        KotlinParser.LogicalOrExpressionContext: visit_logical_or_expression,
+        KotlinParser.LogicalAndExpressionContext: visit_logical_and_expression,
+        KotlinParser.EqualityExpressionContext: visit_equality_expression,
+        KotlinParser.RelationalExpressionContext: visit_relational_expression,
+        KotlinParser.AdditiveExpressionContext: visit_additive_expression,
+        KotlinParser.MultiplicativeExpressionContext: visit_multiplicative_expression,
+        KotlinParser.UnaryExpressionContext: visit_unary_expression,
+        KotlinParser.MembershipExpressionContext: visit_memebership_expression,
+        KotlinParser.PrimaryExpressionContext: visit_primary_expression
+    }
+
+    # Operand type required by the operator (None if any, as long as both sides match), result type and name
+    binary_expression_type_rules = {
+        KotlinParser.LogicalOrExpressionContext: (KOTLIN_BOOLEAN, KOTLIN_BOOLEAN, "logical or"),
+        KotlinParser.LogicalAndExpressionContext: (KOTLIN_BOOLEAN, KOTLIN_BOOLEAN, "logical and"),
+        KotlinParser.EqualityExpressionContext: (None, KOTLIN_BOOLEAN, "equality"),
+        KotlinParser.RelationalExpressionContext: (KOTLIN_INT, KOTLIN_BOOLEAN, "relational"),
+        KotlinParser.AdditiveExpressionContext: (KOTLIN_INT, KOTLIN_INT, "additive"),
+        KotlinParser.MultiplicativeExpressionContext: (KOTLIN_INT, KOTLIN_INT, "multiplicative")
+    }
+
+    expression_type_checkers = {
+        **dict.fromkeys(binary_expression_types, check_binary_expression_type),
+        KotlinParser.UnaryExpressionContext: check_unary_expression_type,
+        KotlinParser.MembershipExpressionContext: check_membership_expression_type,
+        KotlinParser.PrimaryExpressionContext: check_primary_expression_type
+    }
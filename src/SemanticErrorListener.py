@@ -10,7 +10,8 @@ class SemanticErrorListener:
         typically when a variable or function is used incorrectly according to the language's semantics.
 
         Attributes:
-            errors (list): A list that stores error messages related to semantic errors.
+            errors (list): A list that stores the line, column and message of each semantic error, 
+                           formatted only when the errors are retrieved.
     """
 
     def __init__(self):
@@ -18,7 +19,7 @@ class SemanticErrorListener:
         """
         Initializes a new SemanticErrorListener.
 
-        Sets up an empty list `errors` to store any semantic error messages detected during analysis.
+        Sets up an empty list `errors` to store any semantic errors detected during analysis.
         """
  
         super().__init__()
@@ -29,7 +30,7 @@ class SemanticErrorListener:
 
         """
         Called when a semantic error is detected.
-        Formats the error message and stores it in the `errors` list.
+        Stores the error in the `errors` list; the message is formatted by `get_errors`.
 
         Args:
             line (int): The line number where the error occurred.
@@ -38,12 +39,7 @@ class SemanticErrorListener:
 
         """
 
-        error_message = (
-            f"❌ Oops! Semantic Error Detected:\n"
-            f"   🔍 {msg}\n"
-            f"   📍 line {line}, column {column}"
-        )
-        self.errors.append(error_message)
+        self.errors.append((line, column, msg))
 
 
     def has_errors(self):
@@ -67,4 +63,9 @@ class SemanticErrorListener:
             list: A list of error messages that have been captured by the listener.
         """
         
-        return self.errors
+        return [
+            f"❌ Oops! Semantic Error Detected:\n"
+            f"   🔍 {msg}\n"
+            f"   📍 line {line}, column {column}"
+            for line, column, msg in self.errors
+        ]
@@ -12,6 +12,8 @@ class Symbol:
         mutable (bool): Indicates whether the variable is mutable.
         value (any): The current value of the variable, which can be `None` if not assigned.
     """
+
+    __slots__ = ("name", "type", "mutable", "value") # No per-instance __dict__
     
     def __init__(self, name, type, mutable, value):
         
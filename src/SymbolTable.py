@@ -1,3 +1,10 @@
+import logging
+import sys
+from FunctionSymbol import FunctionSymbol
+
+logger = logging.getLogger(__name__)
+
+
 class SymbolTable:
 
     """
@@ -8,8 +15,19 @@ class SymbolTable:
     and looking up symbols in the current scope or across all active scopes.
 
     Attributes:
-        scopes (list): A stack of scopes, where each scope is a dictionary containing "variables", 
-                        "functions", and "classes".
+        scopes (list): A stack of scopes, where each scope is a single dictionary of the symbols declared 
+                        in it, keyed by ("variable", name), ("function", name) or ("class", name).
+        variables (dict): The variables visible from the current scope, by name: a variable declared in 
+                          an inner scope replaces the one it shadows until its scope is removed.
+        functions (dict): The functions visible from the current scope, by (name, parameter types): 
+                          an overloaded version declared in an inner scope replaces the one it shadows 
+                          until its scope is removed.
+        function_versions (dict): For each function name, the overloaded versions declared in the nearest 
+                                  scope declaring that name, grouped by number of parameters.
+        classes (dict): The classes visible from the current scope, by name.
+        shadowed_bindings (list): A stack parallel to `scopes`; each level lists the (bindings, key, previous) 
+                                  entries replaced by the symbols declared in that scope, so that they can 
+                                  be restored when the scope is removed.
     """
 
     def __init__(self):
@@ -17,16 +35,26 @@ class SymbolTable:
         """
         Initializes a new symbol table with an initial scope.
 
-        This constructor sets up a stack of scopes, starting with an empty scope that contains
-        empty dictionaries for variables, functions, and classes.
+        This constructor sets up a stack of scopes, starting with an empty scope.
 
         Attributes:
-            scopes (list): A stack of scopes, each represented as a dictionary containing 
-                        "variables", "functions", and "classes".
+            scopes (list): A stack of scopes, each represented as a dictionary of the symbols declared 
+                        in it, keyed by kind and name.
+            variables (dict): The variables visible from the current scope, by name.
+            functions (dict): The functions visible from the current scope, by (name, parameter types).
+            function_versions (dict): The overloaded versions of each function in the nearest scope declaring it.
+            classes (dict): The classes visible from the current scope, by name.
+            shadowed_bindings (list): The bindings replaced in each scope, restored on its removal.
         """
 
-        self.scopes = [{"variables": {}, "functions": {}, "classes": set()}] # Stack: each level is a dictionary representing a scope.
-        print(f"    📍 Initial scope added.") 
+        self.scopes = [{}] # Stack: each level is a dictionary representing a scope.
+        self.variables = {}
+        self.functions = {}
+        self.function_versions = {}
+        self.classes = {}
+        self.shadowed_bindings = [[]]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    📍 Initial scope added.")
 
 
     def __repr__(self):
@@ -45,8 +73,10 @@ class SymbolTable:
         
         """Adds a new scope by appending an empty dictionary to the stack."""
 
-        self.scopes.append({"variables": {}, "functions": {}, "classes": set()})
-        print(f"    📍 Current scope added.") 
+        self.scopes.append({})
+        self.shadowed_bindings.append([])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    📍 Current scope added.")
 
 
     def remove_scope(self):       
@@ -58,14 +88,36 @@ class SymbolTable:
         """
         
         if len(self.scopes) > 1:
-            removed_scope = self.scopes[-1]
-            self.scopes.pop()
-            print(f"    📍 Last scope removed: {removed_scope}") 
+            removed_scope = self.scopes.pop()
+
+            # Restore the symbols shadowed by the removed scope, or hide the ones it introduced
+            for bindings, key, previous in reversed(self.shadowed_bindings.pop()):
+                if previous is None:
+                    del bindings[key]
+                else:
+                    bindings[key] = previous
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("    📍 Last scope removed: %s", removed_scope)
         
         else:
             raise ValueError("❌ Cannot remove the global scope.")
 
 
+    def add_binding(self, bindings, key, symbol):
+        
+        """Makes a symbol declared in the current scope visible, logging the binding it shadows.
+
+        Args:
+            bindings (dict): The visible symbols of one kind (`variables`, `functions`, `function_versions` 
+                             or `classes`).
+            key: The key of the symbol in `bindings`.
+            symbol: The symbol to bind.
+        """
+
+        self.shadowed_bindings[-1].append((bindings, key, bindings.get(key)))
+        bindings[key] = symbol
+
+
     ##### Variables #####
 
 
@@ -73,6 +125,9 @@ class SymbolTable:
         
         """Searches for a variable in the active scopes, starting from the current one.
 
+        The visible variables are kept in a single dictionary, so the search is one lookup 
+        whatever the depth of the scopes.
+
         Args:
             name (str): The name of the variable to search for.
 
@@ -80,11 +135,7 @@ class SymbolTable:
             variable: The variable if found, otherwise None.
         """
         
-        for scope in reversed(self.scopes):
-            if name in scope["variables"]:
-                return scope["variables"][name]
-        
-        return None # not found
+        return self.variables.get(name)
     
 
     def lookup_variable_in_current_scope(self, name):
@@ -99,8 +150,8 @@ class SymbolTable:
         
         """
         
-        current_scope = self.scopes[-1]["variables"]  # Topmost scope
-        return current_scope.get(name, None)
+        current_scope = self.scopes[-1]  # Topmost scope
+        return current_scope.get(("variable", name), None)
 
 
     def add_variable(self, name, variable):
@@ -115,16 +166,19 @@ class SymbolTable:
             ValueError: If the variable already exists in the current scope.
         """
         
-        current_scope = self.scopes[-1]["variables"]
-        
-        if name in current_scope:
+        name = sys.intern(name) # Keys are interned, so that lookups with interned names compare by identity
+
+        # A single probe both declares the variable and detects a previous declaration
+        if self.scopes[-1].setdefault(("variable", name), variable) is not variable:
             raise ValueError(f"❌ Variable '{name}' is already declared in the current scope.")
         
-        current_scope[name] = variable
-        print(f"    📍 Variable '{name}' of type '{variable.type}' (mutable: {variable.mutable}) added to the current scope with value '{variable.value}'.")
+        self.add_binding(self.variables, name, variable)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    📍 Variable '%s' of type '%s' (mutable: %s) added to the current scope with value '%s'.", 
+                         name, variable.type, variable.mutable, variable.value)
 
 
-    def update_variable(self, name, new_value):
+    def update_variable(self, name, new_value, variable=None):
         
         """
         Updates an existing variable in the active scopes.
@@ -132,18 +186,21 @@ class SymbolTable:
         Args:
             name (str): The name of the variable to update.
             new_value (str): The new value to assign to the variable.
+            variable (symbol, optional): The variable, if the caller has already looked it up; 
+                                         the scopes are then not searched again.
 
         Raises:
             ValueError: If the variable does not exist in any active scope.
         """
         
-        for scope in reversed(self.scopes):
-            if name in scope["variables"]:
-                scope["variables"][name].value = new_value
-                print(f"    📍 Variable '{name}' assigned new value: {new_value}.")
-                return
-        
-        raise ValueError(f"❌ Variable '{name}' is not declared in any scope.")
+        if variable is None:
+            variable = self.lookup_variable(name)
+            if variable is None:
+                raise ValueError(f"❌ Variable '{name}' is not declared in any scope.")
+
+        variable.value = new_value
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    📍 Variable '%s' assigned new value: %s.", name, new_value)
 
 
     def get_variable_info(self, name):
@@ -199,20 +256,15 @@ class SymbolTable:
 
         Args:
             name (str): The name of the function to look up.
-            param_types (str): A string representing the types of the function's parameters (e.g., "Int, String").
+            param_types (tuple): The types of the function's parameters (e.g., ("Int", "String")).
 
         Returns:
-            dict or None: The function object containing its details (e.g., parameter types, names, return type) 
+            FunctionSymbol or None: The function object containing its details (e.g., parameter types, names, return type) 
             if found, or None if no matching function exists in the current or parent scopes.
         """
         
-        for scope in reversed(self.scopes):
-            if name in scope["functions"]:
-                for fun in scope["functions"][name]:
-                    if fun["param_types"] == param_types:
-                        return fun
-        
-        return None
+        # The visible versions are keyed by signature, so the search is a single lookup
+        return self.functions.get((name, param_types))
 
 
     def add_function(self, name, param_types, param_names, return_type):
@@ -222,25 +274,32 @@ class SymbolTable:
 
         Args:
             name (str): The name of the function to add.
-            param_types (str): A string representing the types of the function's parameters (e.g., "Int, String").
-            param_names (str): A string representing the names of the function's parameters (e.g., "x, y").
+            param_types (tuple): The types of the function's parameters (e.g., ("Int", "String")).
+            param_names (tuple): The names of the function's parameters (e.g., ("x", "y")).
             return_type (str): The return type of the function.
 
         Raises:
             ValueError: If a function with the same name and parameter types already exists in the current scope.
         """
         
-        current_scope = self.scopes[-1]["functions"]
+        name = sys.intern(name)
+        current_scope = self.scopes[-1]
         
-        if name not in current_scope:
-            current_scope[name] = []
+        # Overloaded versions of the function, grouped by number of parameters and keyed by their parameter types
+        versions_by_arity = current_scope.get(("function", name))
+        if versions_by_arity is None:
+            current_scope[("function", name)] = versions_by_arity = {}
+            self.add_binding(self.function_versions, name, versions_by_arity)
+        versions = versions_by_arity.setdefault(len(param_types), {})
 
-        for fun in current_scope[name]:
-            if fun["param_types"] == param_types:
-                raise ValueError(f"❌ function '{name}' with signature '{param_types}' is already declared in current scope.")
+        fun = FunctionSymbol(param_types, param_names, return_type)
+        if versions.setdefault(param_types, fun) is not fun:
+            raise ValueError(f"❌ function '{name}' with signature '{', '.join(param_types or ())}' is already declared in current scope.")
         
-        current_scope[name].append({"param_types": param_types, "param_names": param_names, "return_type": return_type})
-        print(f"    📍 Function '{name}' with signature '{param_types}' and return type '{return_type}' added to the current scope.")
+        self.add_binding(self.functions, (name, param_types), fun)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    📍 Function '%s' with signature '%s' and return type '%s' added to the current scope.", 
+                         name, ", ".join(param_types), return_type)
 
 
     def get_function_return_type(self, name, param_types):
@@ -250,7 +309,7 @@ class SymbolTable:
 
         Args:
             name (str): The name of the function.
-            param_types (str): A string representing the types of the function's parameters (e.g., "Int, String").
+            param_types (tuple): The types of the function's parameters (e.g., ("Int", "String")).
 
         Returns:
             str: The return type of the function.
@@ -259,13 +318,11 @@ class SymbolTable:
             ValueError: If the function is not found in any scope.
         """
         
-        for scope in reversed(self.scopes):
-            if name in scope["functions"]:
-                for fun in scope["functions"][name]:
-                    if fun["param_types"] == param_types:
-                        return fun["return_type"]
+        fun = self.lookup_function(name, param_types)
+        if fun:
+            return fun.return_type
         
-        raise ValueError(f"❌ Function '{name}' with parameters {param_types} is not declared in any scope.")
+        raise ValueError(f"❌ Function '{name}' with parameters {', '.join(param_types or ())} is not declared in any scope.")
     
 
     def get_function_params(self, name):
@@ -277,15 +334,18 @@ class SymbolTable:
             name (str): The name of the function.
 
         Returns:
-            list: A list of dictionaries containing the parameter types and return type for each overloaded version of the function.
+            dict: A dictionary mapping each number of parameters to the overloaded versions of the function 
+                  with that many parameters, keyed by their parameter types; each version is a FunctionSymbol 
+                  holding its parameter types, names and return type.
 
         Raises:
             ValueError: If the function is not found in any scope.
         """
         
-        for scope in reversed(self.scopes):
-            if name in scope["functions"]:
-                return scope["functions"][name]  # Return all the overloaded versions of the function
+        # The versions of the nearest scope declaring the function are kept by name, so no scope is searched
+        versions_by_arity = self.function_versions.get(name)
+        if versions_by_arity is not None:
+            return versions_by_arity
         
         raise ValueError(f"❌ Function '{name}' is not declared in any scope.")
 
@@ -305,13 +365,17 @@ class SymbolTable:
             ValueError: If the class already exists in the current scope.
         """
 
-        current_scope = self.scopes[-1]["classes"]
+        name = sys.intern(name)
+        current_scope = self.scopes[-1]
+        key = ("class", name)
         
-        if name in current_scope:
+        if key in current_scope:
             raise ValueError(f"❌ Class '{name}' is already declared in the current scope.")
         
-        current_scope.add(name)
-        print(f"    📍 Class '{name}' added to the current scope.")
+        current_scope[key] = True
+        self.add_binding(self.classes, name, True)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    📍 Class '%s' added to the current scope.", name)
 
 
     def lookup_class(self, name):
@@ -326,8 +390,5 @@ class SymbolTable:
             bool: True if the class exists, False otherwise.
         """
         
-        for scope in reversed(self.scopes):
-            if name in scope["classes"]:
-                return True
-            
-        return False
\ No newline at end of file
+        # The visible classes are kept in a single dictionary, so the search is one lookup
+        return name in self.classes
\ No newline at end of file
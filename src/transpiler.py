@@ -1,5 +1,6 @@
 import os
 import argparse
+import logging
 from antlr4 import *
 from generated.antlr.KotlinLexer import KotlinLexer
 from generated.antlr.KotlinParser import KotlinParser
@@ -9,6 +10,8 @@ from KotlinToSwiftVisitor import KotlinToSwiftVisitor
 from SemanticErrorListener import SemanticErrorListener
 from SymbolTable import SymbolTable
 
+logger = logging.getLogger(__name__)
+
 
 def transpile_kotlin_code(kotlin_code_path):
 
@@ -147,7 +150,10 @@ def parse_kotlin_code(kotlin_code):
         if lexical_error_listener.has_errors() or syntax_error_listener.has_errors():
             raise Exception("\n".join(lexical_error_listener.get_errors() + syntax_error_listener.get_errors()))  # Raise if lexical or syntax errors are found            
         else:
-            print(f"✅ Tree generated successfully:\n    {tree.toStringTree(recog=parser)}")        
+            print("✅ Tree generated successfully.")
+            # Serializing the whole tree is proportional to the input, so it is only done when tracing
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("    %s", tree.toStringTree(recog=parser))
             return tree  # Return the parse tree if parsing is successful
     
     except Exception as ex: